@@ -6,20 +6,35 @@ Supports librosa (primary) and essentia (optional) backends.
 Extended features: spectrograms, per-beat time-series, onset/chord/HPSS analysis.
 """
 
+import functools
+import os
 import sys
 import json
 import warnings
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
 import numpy as np
 
 try:
     import librosa
+    import soundfile as sf
 
     HAS_LIBROSA = True
 except ImportError:
     HAS_LIBROSA = False
 
+try:
+    import pyfftw
+    import pyfftw.interfaces.scipy_fft
+    import scipy.fft
+
+    HAS_FFTW = True
+except ImportError:
+    HAS_FFTW = False
+
 try:
     import essentia.standard as es
 
@@ -27,82 +42,292 @@ try:
 except ImportError:
     HAS_ESSENTIA = False
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Suppress n_fft warnings — we intentionally analyze short captures
+warnings.filterwarnings("ignore", message="n_fft=", category=UserWarning)
+warnings.filterwarnings("ignore", message="Trying to estimate tuning", category=UserWarning)
+
+# Sample rate the librosa analyses run at (librosa's own default)
+ANALYSIS_SR = 22050
+
+# Threads full_analysis runs its independent passes on
+_ANALYSIS_WORKERS = 4
+
+# Below this many samples (~186 ms at 22.05 kHz) beat tracking and HPSS
+# (31-frame median filters) have too few frames to say anything, so only
+# those passes are skipped
+_MIN_RHYTHM_SAMPLES = 4096
+
+# Below this many samples (~93 ms at 22.05 kHz) the CQT's low-octave filters
+# are mostly zero padding and cost ~20x the rest of the analysis, so chroma
+# comes from the STFT instead
+_MIN_CQT_SAMPLES = 2048
+
+# Frames per block when downmixing multichannel files in _load (~1.5 s at 44.1 kHz)
+_LOAD_BLOCK_FRAMES = 1 << 16
+
+# Sample rate essentia's extractors are tuned for
+_ESSENTIA_SR = 44100
+
 KEY_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
 
-# 24 chord templates: 12 major + 12 minor triads as normalized 12-bin vectors
-_CHORD_TEMPLATES = {}
-for i, name in enumerate(KEY_NAMES):
-    # Major triad: root, major third (+4), fifth (+7)
-    major = np.zeros(12)
-    major[i] = 1.0
-    major[(i + 4) % 12] = 1.0
-    major[(i + 7) % 12] = 1.0
-    major /= np.linalg.norm(major)
-    _CHORD_TEMPLATES[name] = major
-
-    # Minor triad: root, minor third (+3), fifth (+7)
-    minor = np.zeros(12)
-    minor[i] = 1.0
-    minor[(i + 3) % 12] = 1.0
-    minor[(i + 7) % 12] = 1.0
-    minor /= np.linalg.norm(minor)
-    _CHORD_TEMPLATES[f"{name}m"] = minor
+# 24 chord templates: 12 major + 12 minor triads as normalized 12-bin rows
+# of _CHORD_MATRIX, named by the parallel _CHORD_NAMES list (C, Cm, C#, ...)
+_CHORD_NAMES = [f"{name}{quality}" for name in KEY_NAMES for quality in ("", "m")]
+
+
+def _triads(third: int) -> np.ndarray:
+    """(12, 12) matrix of triads on every root: root, *third*, fifth (+7)."""
+    roots = np.arange(12)
+    triads = np.zeros((12, 12))
+    triads[roots, roots] = 1.0
+    triads[roots, (roots + third) % 12] = 1.0
+    triads[roots, (roots + 7) % 12] = 1.0
+    return triads
+
+
+# Interleave major (+4) and minor (+3) rows to match _CHORD_NAMES
+_CHORD_MATRIX = np.stack([_triads(4), _triads(3)], axis=1).reshape(24, 12)
+_CHORD_MATRIX /= np.linalg.norm(_CHORD_MATRIX, axis=1, keepdims=True)
+# float32 like librosa's features, so the scoring matmul is a single sgemm
+_CHORD_MATRIX = np.ascontiguousarray(_CHORD_MATRIX, dtype=np.float32)
 
 
 def _prev_power_of_2(n: int) -> int:
-    """Largest power of 2 <= n."""
-    p = 1
-    while p * 2 <= n:
-        p *= 2
-    return p
+    """Largest power of 2 <= n (1 for n < 1)."""
+    return 1 << (n.bit_length() - 1) if n > 0 else 1
+
+
+def _load(filepath: str, sr: int | None = ANALYSIS_SR) -> tuple[np.ndarray, int]:
+    """Decode to mono float32, resampling only if the file isn't already at *sr*.
+
+    Captures are WAV, so read them straight through libsndfile; anything it
+    can't open goes through librosa's audioread fallback. ``sr=None`` keeps
+    the native rate.
+    """
+    try:
+        f = sf.SoundFile(filepath)
+    except sf.LibsndfileError:
+        return librosa.load(filepath, sr=sr)
+    with f:
+        native_sr = f.samplerate
+        if f.channels == 1:
+            y = f.read(dtype="float32")
+        else:
+            # Downmix block by block so a long multichannel capture never
+            # sits in memory at full width alongside its mono mix
+            y = np.empty(f.frames, dtype=np.float32)
+            pos = 0
+            for block in f.blocks(blocksize=_LOAD_BLOCK_FRAMES, dtype="float32", always_2d=True):
+                block.mean(axis=1, out=y[pos:pos + len(block)])
+                pos += len(block)
+            y = y[:pos]
+    if sr is None or sr == native_sr:
+        return y, native_sr
+    return librosa.resample(y, orig_sr=native_sr, target_sr=sr), sr
+
+
+def _load_shared(filepath: str, sr: int | None = ANALYSIS_SR):
+    """Decode once for both backends.
+
+    Returns ``(y, sr, native)``: the librosa signal at *sr* plus, when
+    essentia is installed, the native-rate signal it resamples from, so
+    essentia works from full-bandwidth audio without a second decode.
+    """
+    if not HAS_ESSENTIA:
+        return *_load(filepath, sr=sr), None
+    native = _load(filepath, sr=None)
+    if sr is None or sr == native[1]:
+        return *native, native
+    return librosa.resample(native[0], orig_sr=native[1], target_sr=sr), sr, native
+
+
+def preload():
+    """Import librosa's lazily loaded submodules ahead of the first analysis.
+
+    librosa defers feature/beat/onset/decompose (and numba behind them) to
+    first attribute access, which takes seconds on a cold start; callers can
+    run this in a thread while a capture is still recording.
+    """
+    if HAS_LIBROSA:
+        for name in ("feature", "beat", "onset", "decompose", "util"):
+            getattr(librosa, name)
+
+
+def _use_fftw(workers: int):
+    """Route librosa's FFTs (all via scipy.fft) through pyFFTW, if installed.
+
+    Called when an analysis starts rather than at import, since scipy's FFT
+    backend is process-wide. FFTW's threads are split across the *workers*
+    analysis threads so the two levels don't oversubscribe the CPU.
+    """
+    if not HAS_FFTW:
+        return
+    pyfftw.config.NUM_THREADS = max(1, (os.cpu_count() or 1) // workers)
+    _register_fftw()
+
+
+@functools.cache
+def _register_fftw():
+    pyfftw.interfaces.cache.enable()
+    scipy.fft.set_global_backend(pyfftw.interfaces.scipy_fft)
+
+
+def _too_short(y: np.ndarray) -> bool:
+    return len(y) < _MIN_RHYTHM_SAMPLES
+
+
+def _fft_params(num_samples: int) -> tuple[int, int]:
+    """(n_fft, hop) scaled to signal length so short captures don't zero-pad."""
+    n_fft = min(2048, max(64, _prev_power_of_2(num_samples)))
+    return n_fft, n_fft // 4
+
+
+def _magnitude(y: np.ndarray, n_fft: int, hop: int) -> np.ndarray:
+    """Magnitude spectrogram shared by every STFT-based feature."""
+    return np.abs(librosa.stft(y, n_fft=n_fft, hop_length=hop))
+
+
+def _log_mel(S: np.ndarray, sr: int, n_fft: int, hop: int) -> np.ndarray:
+    """Log-power mel spectrogram of a magnitude STFT.
+
+    The representation librosa's onset envelope is built from (at n_fft 2048)
+    and MFCCs start from, so one copy serves beats, onsets, MFCC and the
+    mel PNG.
+    """
+    mel = librosa.feature.melspectrogram(S=S ** 2, sr=sr, n_fft=n_fft, hop_length=hop)
+    return librosa.power_to_db(mel)
+
+
+def _beat_track(log_mel: np.ndarray, sr: int, hop: int):
+    """``librosa.beat.beat_track`` from a precomputed log-mel (same median-aggregated envelope)."""
+    onset_env = librosa.onset.onset_strength(S=log_mel, sr=sr, hop_length=hop, aggregate=np.median)
+    return librosa.beat.beat_track(onset_envelope=onset_env, sr=sr, hop_length=hop)
+
+
+def _chroma(y: np.ndarray, sr: int, S: np.ndarray, n_fft: int, hop: int) -> np.ndarray:
+    """chroma_cqt, or chroma_stft from the magnitude STFT for tiny signals."""
+    if len(y) < _MIN_CQT_SAMPLES:
+        return librosa.feature.chroma_stft(S=S ** 2, sr=sr, n_fft=n_fft, hop_length=hop)
+    return librosa.feature.chroma_cqt(y=y, sr=sr, hop_length=hop)
+
+
+def _sync_mean(feature: np.ndarray, frames: np.ndarray) -> np.ndarray:
+    """Mean of a (d, T) feature over each segment between *frames*.
+
+    Same segmentation as ``librosa.util.sync(..., aggregate=np.mean)`` —
+    boundaries are padded with 0 and T — but done as one reduceat instead
+    of a Python loop over slices.
+    """
+    n = feature.shape[-1]
+    frames = np.asarray(frames)
+    bounds = np.unique(np.concatenate(([0], frames[(frames >= 0) & (frames <= n)], [n])))
+    sums = np.add.reduceat(feature, bounds[:-1], axis=-1)
+    return sums / np.diff(bounds).astype(feature.dtype)
+
+
+def _rounded(values, ndigits: int) -> np.ndarray:
+    """Round an array in one vectorized pass, ready for to_json().
+
+    Widened to float64 first so float32 features don't serialize with
+    single-precision noise (0.2027 → 0.20270000398…), and made C-contiguous
+    because orjson only serializes contiguous arrays.
+    """
+    return np.ascontiguousarray(np.round(np.asarray(values, dtype=np.float64), ndigits))
+
+
+def _mean_max_std(a: np.ndarray) -> tuple[float, float, float]:
+    """Mean, max and std of a 1-D array, reusing the mean for the deviation."""
+    mean = a.mean()
+    dev = a - mean
+    dev *= dev
+    return float(mean), float(a.max()), float(np.sqrt(dev.mean()))
+
+
+def _json_default(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def to_json(result, indent: bool = True) -> str:
+    """Serialize an analysis result (2-space indent, or compact if not *indent*).
+
+    Results hold numpy arrays; orjson (optional) serializes them natively,
+    the stdlib fallback converts them to lists on the way out.
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(result, option=option).decode()
+    if indent:
+        return json.dumps(result, indent=2, default=_json_default)
+    return json.dumps(result, separators=(",", ":"), default=_json_default)
+
+
+def _estimate_chords(chroma: np.ndarray) -> list[str]:
+    """Estimate one chord per column of a (12, N) chroma matrix.
+
+    Cosine similarity against every template for every column is a single
+    matmul; silent columns come back as "N" (no chord).
+    """
+    chroma = chroma.astype(np.float32, copy=False)
+    norms = np.linalg.norm(chroma, axis=0)
+    voiced = norms >= 1e-8
+    sims = _CHORD_MATRIX @ (chroma / np.where(voiced, norms, 1.0))
+    best = sims.argmax(axis=0)
+    return [_CHORD_NAMES[i] if v else "N" for i, v in zip(best.tolist(), voiced.tolist())]
 
 
 def _estimate_chord(chroma_vector: np.ndarray) -> str:
     """Estimate chord from a 12-bin chroma vector using cosine similarity."""
-    norm = np.linalg.norm(chroma_vector)
-    if norm < 1e-8:
-        return "N"  # no chord / silence
-    chroma_norm = chroma_vector / norm
-    best_chord = "N"
-    best_sim = -1.0
-    for name, template in _CHORD_TEMPLATES.items():
-        sim = float(np.dot(chroma_norm, template))
-        if sim > best_sim:
-            best_sim = sim
-            best_chord = name
-    return best_chord
-
-
-def analyze_with_librosa(filepath: str, y=None, sr=None) -> dict:
-    if y is None or sr is None:
-        y, sr = librosa.load(filepath)
+    return _estimate_chords(chroma_vector.reshape(12, 1))[0]
 
-    # Scale FFT size to signal length so short captures don't zero-pad
-    n_fft = min(2048, max(64, _prev_power_of_2(len(y))))
-    hop = n_fft // 4
 
-    # Suppress n_fft warnings — we intentionally analyze short captures
-    warnings.filterwarnings("ignore", message="n_fft=", category=UserWarning)
-    warnings.filterwarnings("ignore", message="Trying to estimate tuning", category=UserWarning)
-
-    tempo, beats = librosa.beat.beat_track(y=y, sr=sr)
-    rms = librosa.feature.rms(y=y, frame_length=n_fft, hop_length=hop)[0]
-    centroid = librosa.feature.spectral_centroid(y=y, sr=sr, n_fft=n_fft, hop_length=hop)[0]
-    rolloff = librosa.feature.spectral_rolloff(y=y, sr=sr, n_fft=n_fft, hop_length=hop)[0]
-    zcr = librosa.feature.zero_crossing_rate(y, frame_length=n_fft, hop_length=hop)[0]
-    chroma = librosa.feature.chroma_cqt(y=y, sr=sr, hop_length=hop)
-    mfccs = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13, n_fft=n_fft, hop_length=hop)
+def analyze_with_librosa(filepath: str, y=None, sr=None, S=None, tempo=None, rms=None,
+                         centroid=None, rolloff=None, chroma=None, log_mel=None) -> dict:
+    """Summary features. Precomputed features (see full_analysis) are reused."""
+    if y is None or sr is None:
+        y, sr = _load(filepath)
+
+    n_fft, hop = _fft_params(len(y))
+    if S is None:
+        S = _magnitude(y, n_fft, hop)
+    if log_mel is None:
+        log_mel = _log_mel(S, sr, n_fft, hop)
+
+    if tempo is None:
+        tempo = 0.0 if _too_short(y) else _beat_track(log_mel, sr, hop)[0]
+    if rms is None:
+        rms = librosa.feature.rms(y=y, frame_length=n_fft, hop_length=hop)[0]
+    if centroid is None:
+        centroid = librosa.feature.spectral_centroid(S=S, sr=sr, n_fft=n_fft, hop_length=hop)[0]
+    if rolloff is None:
+        rolloff = librosa.feature.spectral_rolloff(S=S, sr=sr, n_fft=n_fft, hop_length=hop)[0]
+    # ZCR only feeds a mean, so 50% frame overlap is plenty
+    zcr = librosa.feature.zero_crossing_rate(y, frame_length=n_fft, hop_length=n_fft // 2)[0]
+    if chroma is None:
+        chroma = _chroma(y, sr, S, n_fft, hop)
+    mfccs = librosa.feature.mfcc(S=log_mel, sr=sr, n_mfcc=13)
 
     key_profile = chroma.mean(axis=1)
     estimated_key = KEY_NAMES[int(np.argmax(key_profile))]
+    energy_mean, energy_max, energy_std = _mean_max_std(rms)
 
     return {
         "tempo": float(tempo),
         "estimated_key": estimated_key,
         "energy": {
-            "mean": round(float(np.mean(rms)), 4),
-            "max": round(float(np.max(rms)), 4),
-            "std": round(float(np.std(rms)), 4),
+            "mean": round(energy_mean, 4),
+            "max": round(energy_max, 4),
+            "std": round(energy_std, 4),
         },
         "brightness": {
             "centroid_mean": round(float(np.mean(centroid)), 1),
@@ -111,143 +336,168 @@ def analyze_with_librosa(filepath: str, y=None, sr=None) -> dict:
         "dynamics": {
             "zcr_mean": round(float(np.mean(zcr)), 4),
         },
-        "key_profile": [round(v, 4) for v in key_profile.tolist()],
+        "key_profile": _rounded(key_profile, 4),
         "mfcc_summary": {
-            "mean": [round(v, 4) for v in mfccs.mean(axis=1).tolist()],
-            "std": [round(v, 4) for v in mfccs.std(axis=1).tolist()],
+            "mean": _rounded(mfccs.mean(axis=1), 4),
+            "std": _rounded(mfccs.std(axis=1), 4),
         },
     }
 
 
-def generate_spectrograms(filepath: str, y=None, sr=None) -> dict:
-    """Generate mel spectrogram and chromagram PNGs. Returns dict of paths."""
-    import matplotlib
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
-    import librosa.display
+def _save_heatmap(data: np.ndarray, path: Path, width: int = 1000, height: int = 400):
+    """Write a (bins, frames) array as a magma PNG, lowest bin at the bottom.
 
+    Rows and columns are repeated up to roughly *width* x *height* so short
+    captures and 12-bin chromagrams stay legible; captures with more frames
+    than *width* are averaged down to *width* columns.
+    """
+    import matplotlib.image
+
+    lo, hi = float(data.min()), float(data.max())
+    norm = (data - lo) / (hi - lo) if hi > lo else np.zeros_like(data)
+    rows, cols = norm.shape
+    if cols > width:
+        # Mean over near-equal runs of frames, one run per output column
+        edges = np.linspace(0, cols, width + 1).astype(int)
+        norm = np.add.reduceat(norm, edges[:-1], axis=1) / np.diff(edges)
+        cols = width
+    img = np.repeat(np.repeat(norm, max(1, height // rows), axis=0), max(1, width // cols), axis=1)
+    matplotlib.image.imsave(path, img, cmap="magma", vmin=0.0, vmax=1.0, origin="lower")
+
+
+def generate_spectrograms(filepath: str, y=None, sr=None, S=None, chroma=None,
+                          log_mel=None) -> dict:
+    """Generate mel spectrogram and chromagram PNGs. Returns dict of paths.
+
+    Images are the raw colour-mapped arrays (no axes or colorbar): time runs
+    left to right across the capture, low mel bands / pitch class C at the
+    bottom.
+    """
     if y is None or sr is None:
-        y, sr = librosa.load(filepath)
+        y, sr = _load(filepath)
 
     stem = Path(filepath).stem
     out_dir = Path(filepath).parent
     paths = {}
 
-    # Mel spectrogram
-    n_fft = min(2048, max(64, _prev_power_of_2(len(y))))
-    hop = n_fft // 4
-    S = librosa.feature.melspectrogram(y=y, sr=sr, n_fft=n_fft, hop_length=hop)
-    S_db = librosa.power_to_db(S, ref=np.max)
-
-    fig, ax = plt.subplots(figsize=(10, 4))
-    librosa.display.specshow(S_db, sr=sr, hop_length=hop, x_axis="time", y_axis="mel", ax=ax)
-    ax.set_title("Mel Spectrogram")
-    fig.colorbar(ax.collections[0], ax=ax, format="%+2.0f dB")
-    fig.tight_layout()
+    # Mel spectrogram (dB reference is irrelevant — the heatmap is min-max scaled)
+    n_fft, hop = _fft_params(len(y))
+    if S is None:
+        S = _magnitude(y, n_fft, hop)
+    if log_mel is None:
+        log_mel = _log_mel(S, sr, n_fft, hop)
     mel_path = out_dir / f"{stem}_mel.png"
-    fig.savefig(mel_path, dpi=100)
-    plt.close(fig)
+    _save_heatmap(log_mel, mel_path)
     paths["mel"] = str(mel_path)
 
     # Chromagram
-    chroma = librosa.feature.chroma_cqt(y=y, sr=sr, hop_length=hop)
-    fig, ax = plt.subplots(figsize=(10, 4))
-    librosa.display.specshow(chroma, sr=sr, hop_length=hop, x_axis="time", y_axis="chroma", ax=ax)
-    ax.set_title("Chromagram")
-    fig.colorbar(ax.collections[0], ax=ax)
-    fig.tight_layout()
+    if chroma is None:
+        chroma = _chroma(y, sr, S, n_fft, hop)
     chroma_path = out_dir / f"{stem}_chroma.png"
-    fig.savefig(chroma_path, dpi=100)
-    plt.close(fig)
+    _save_heatmap(chroma, chroma_path)
     paths["chroma"] = str(chroma_path)
 
     return paths
 
 
-def analyze_time_series(filepath: str, y=None, sr=None) -> dict:
+def analyze_time_series(filepath: str, y=None, sr=None, beat_frames=None, rms=None,
+                        centroid=None, chroma=None) -> dict:
     """Per-beat time-series analysis: energy, brightness, chroma at each beat."""
     if y is None or sr is None:
-        y, sr = librosa.load(filepath)
+        y, sr = _load(filepath)
 
-    n_fft = min(2048, max(64, _prev_power_of_2(len(y))))
-    hop = n_fft // 4
+    if _too_short(y):
+        return {"error": "Signal too short for beat detection"}
 
-    warnings.filterwarnings("ignore", message="n_fft=", category=UserWarning)
-    warnings.filterwarnings("ignore", message="Trying to estimate tuning", category=UserWarning)
+    n_fft, hop = _fft_params(len(y))
 
-    tempo, beat_frames = librosa.beat.beat_track(y=y, sr=sr, hop_length=hop)
+    if beat_frames is None:
+        _, beat_frames = librosa.beat.beat_track(y=y, sr=sr, hop_length=hop)
     if len(beat_frames) < 2:
         return {"error": "Signal too short for beat detection"}
 
-    beat_times = librosa.frames_to_time(beat_frames, sr=sr, hop_length=hop)
+    beat_times = beat_frames * hop / sr
 
-    rms = librosa.feature.rms(y=y, frame_length=n_fft, hop_length=hop)[0]
-    centroid = librosa.feature.spectral_centroid(y=y, sr=sr, n_fft=n_fft, hop_length=hop)[0]
-    chroma = librosa.feature.chroma_cqt(y=y, sr=sr, hop_length=hop)
+    if rms is None:
+        rms = librosa.feature.rms(y=y, frame_length=n_fft, hop_length=hop)[0]
+    if centroid is None:
+        centroid = librosa.feature.spectral_centroid(y=y, sr=sr, n_fft=n_fft, hop_length=hop)[0]
+    if chroma is None:
+        chroma = librosa.feature.chroma_cqt(y=y, sr=sr, hop_length=hop)
 
     # Sync features to beat boundaries
-    rms_sync = librosa.util.sync(rms.reshape(1, -1), beat_frames, aggregate=np.mean)[0]
-    centroid_sync = librosa.util.sync(centroid.reshape(1, -1), beat_frames, aggregate=np.mean)[0]
-    chroma_sync = librosa.util.sync(chroma, beat_frames, aggregate=np.mean)
+    rms_sync = _sync_mean(rms, beat_frames)
+    centroid_sync = _sync_mean(centroid, beat_frames)
+    chroma_sync = _sync_mean(chroma, beat_frames)
 
     return {
-        "beat_times": [round(float(t), 3) for t in beat_times],
-        "energy_per_beat": [round(float(v), 4) for v in rms_sync],
-        "brightness_per_beat": [round(float(v), 1) for v in centroid_sync],
-        "chroma_per_beat": [[round(float(c), 4) for c in col] for col in chroma_sync.T],
+        "beat_times": _rounded(beat_times, 3),
+        "energy_per_beat": _rounded(rms_sync, 4),
+        "brightness_per_beat": _rounded(centroid_sync, 1),
+        "chroma_per_beat": _rounded(chroma_sync.T, 4),
     }
 
 
-def analyze_mir_extended(filepath: str, y=None, sr=None) -> dict:
+def analyze_mir_extended(filepath: str, y=None, sr=None, S=None, beat_frames=None,
+                         chroma=None, log_mel=None) -> dict:
     """Extended MIR: onsets, HPSS, spectral contrast, tonnetz, chord estimation."""
     if y is None or sr is None:
-        y, sr = librosa.load(filepath)
-
-    n_fft = min(2048, max(64, _prev_power_of_2(len(y))))
-    hop = n_fft // 4
+        y, sr = _load(filepath)
 
-    warnings.filterwarnings("ignore", message="n_fft=", category=UserWarning)
-    warnings.filterwarnings("ignore", message="Trying to estimate tuning", category=UserWarning)
+    n_fft, hop = _fft_params(len(y))
+    too_short = _too_short(y)
 
     result = {}
 
-    # Onset detection
-    onset_frames = librosa.onset.onset_detect(y=y, sr=sr, hop_length=hop)
-    onset_times = librosa.frames_to_time(onset_frames, sr=sr, hop_length=hop)
+    # Onset detection (mean-aggregated envelope, librosa's onset_detect default)
+    if S is None:
+        S = _magnitude(y, n_fft, hop)
+    if log_mel is None:
+        log_mel = _log_mel(S, sr, n_fft, hop)
+    onset_env = librosa.onset.onset_strength(S=log_mel, sr=sr, hop_length=hop)
+    onset_frames = librosa.onset.onset_detect(onset_envelope=onset_env, sr=sr, hop_length=hop)
+    onset_times = onset_frames * hop / sr
     duration = len(y) / sr
     result["onsets"] = {
         "count": len(onset_frames),
-        "times": [round(float(t), 3) for t in onset_times],
+        "times": _rounded(onset_times, 3),
         "density_per_sec": round(len(onset_frames) / max(duration, 0.01), 2),
     }
 
-    # Harmonic/Percussive separation
-    y_harm, y_perc = librosa.effects.hpss(y)
-    harm_energy = float(np.sum(y_harm ** 2))
-    perc_energy = float(np.sum(y_perc ** 2))
-    total = harm_energy + perc_energy
-    if total > 0:
-        result["hpss"] = {
-            "harmonic_ratio": round(harm_energy / total, 4),
-            "percussive_ratio": round(perc_energy / total, 4),
-        }
-    else:
-        result["hpss"] = {"harmonic_ratio": 0.0, "percussive_ratio": 0.0}
+    # Harmonic/Percussive separation. Only the energy split is reported, so
+    # separate the magnitude spectrogram and sum the component power
+    # (Parseval) instead of inverting both halves back to audio.
+    if not too_short:
+        H, P = librosa.decompose.hpss(S)
+        harm_energy = float(np.vdot(H, H))
+        perc_energy = float(np.vdot(P, P))
+        total = harm_energy + perc_energy
+        if total > 0:
+            result["hpss"] = {
+                "harmonic_ratio": round(harm_energy / total, 4),
+                "percussive_ratio": round(perc_energy / total, 4),
+            }
+        else:
+            result["hpss"] = {"harmonic_ratio": 0.0, "percussive_ratio": 0.0}
 
     # Spectral contrast
-    contrast = librosa.feature.spectral_contrast(y=y, sr=sr, n_fft=n_fft, hop_length=hop)
-    result["spectral_contrast"] = [round(float(v), 2) for v in contrast.mean(axis=1)]
+    contrast = librosa.feature.spectral_contrast(S=S, sr=sr, n_fft=n_fft, hop_length=hop)
+    result["spectral_contrast"] = _rounded(contrast.mean(axis=1), 2)
+
+    if chroma is None:
+        chroma = _chroma(y, sr, S, n_fft, hop)
 
-    # Tonnetz (tonal centroid)
-    tonnetz = librosa.feature.tonnetz(y=y, sr=sr)
-    result["tonnetz"] = [round(float(v), 4) for v in tonnetz.mean(axis=1)]
+    # Tonnetz (tonal centroid) — projected from the shared chroma rather than
+    # a fresh CQT (same hop as tonnetz's own default once past _too_short)
+    tonnetz = librosa.feature.tonnetz(y=y, sr=sr, chroma=chroma)
+    result["tonnetz"] = _rounded(tonnetz.mean(axis=1), 4)
 
     # Chord estimation via beat-synced chroma
-    tempo, beat_frames = librosa.beat.beat_track(y=y, sr=sr, hop_length=hop)
-    chroma = librosa.feature.chroma_cqt(y=y, sr=sr, hop_length=hop)
-    if len(beat_frames) >= 2:
-        chroma_sync = librosa.util.sync(chroma, beat_frames, aggregate=np.mean)
-        result["chords_per_beat"] = [_estimate_chord(col) for col in chroma_sync.T]
+    if beat_frames is None and not too_short:
+        _, beat_frames = librosa.beat.beat_track(y=y, sr=sr, hop_length=hop)
+    if beat_frames is not None and len(beat_frames) >= 2:
+        chroma_sync = _sync_mean(chroma, beat_frames)
+        result["chords_per_beat"] = _estimate_chords(chroma_sync)
     else:
         # Fallback: single chord for the whole signal
         result["chords_per_beat"] = [_estimate_chord(chroma.mean(axis=1))]
@@ -261,10 +511,9 @@ def _classify(value, thresholds):
     *thresholds* is a list of ``(upper_bound, label)`` pairs in ascending order.
     The last entry should use ``float('inf')`` as the upper bound.
     """
-    for cutoff, label in thresholds:
-        if value < cutoff:
-            return label
-    return thresholds[-1][1]
+    # First cutoff strictly above value (value < cutoff), found in C
+    i = bisect_right(thresholds, value, key=itemgetter(0))
+    return thresholds[min(i, len(thresholds) - 1)][1]
 
 
 def analyze_qualitative(result: dict) -> dict:
@@ -473,8 +722,12 @@ def analyze_qualitative(result: dict) -> dict:
 
 
 def full_analysis(filepath: str, time_series=False, spectrograms=False,
-                  extended=False, qualitative=False) -> dict:
-    """Coordinator: loads audio once, runs requested analyses."""
+                  extended=False, qualitative=False, target_sr=ANALYSIS_SR) -> dict:
+    """Coordinator: loads audio once, runs requested analyses.
+
+    *target_sr* is the analysis sample rate; ``None`` analyses at the file's
+    native rate and skips resampling altogether.
+    """
     if not HAS_LIBROSA:
         return {"error": "librosa not available"}
 
@@ -483,22 +736,61 @@ def full_analysis(filepath: str, time_series=False, spectrograms=False,
         extended = True
         time_series = True
 
-    y, sr = librosa.load(filepath)
-
-    result = {"file": filepath}
-    result["librosa"] = analyze_with_librosa(filepath, y=y, sr=sr)
-
-    if spectrograms:
-        result["spectrograms"] = generate_spectrograms(filepath, y=y, sr=sr)
-
-    if time_series:
-        result["time_series"] = analyze_time_series(filepath, y=y, sr=sr)
-
-    if extended:
-        result["extended"] = analyze_mir_extended(filepath, y=y, sr=sr)
-
-    if HAS_ESSENTIA:
-        result["essentia"] = analyze_with_essentia(filepath)
+    y, sr, native = _load_shared(filepath, sr=target_sr)
+    _use_fftw(workers=_ANALYSIS_WORKERS)
+
+    # The analyses below only read (y, sr) and the shared features, and the
+    # heavy lifting (FFTs, CQT, median filters, PNG encoding) releases the
+    # GIL, so the independent passes run on worker threads.
+    with ThreadPoolExecutor(max_workers=_ANALYSIS_WORKERS) as pool:
+        essentia_fut = pool.submit(analyze_with_essentia, filepath, *native) if native else None
+
+        # Features needed by more than one analysis are computed once here —
+        # chroma_cqt and beat_track dominate the cost of every pass, so they
+        # run on workers while the cheap STFT features are computed here.
+        n_fft, hop = _fft_params(len(y))
+        S = _magnitude(y, n_fft, hop)
+        chroma_fut = pool.submit(_chroma, y, sr, S, n_fft, hop)
+        log_mel = _log_mel(S, sr, n_fft, hop)
+        beat_fut = None if _too_short(y) else pool.submit(_beat_track, log_mel, sr, hop)
+        rms = librosa.feature.rms(y=y, frame_length=n_fft, hop_length=hop)[0]
+        centroid = librosa.feature.spectral_centroid(S=S, sr=sr, n_fft=n_fft, hop_length=hop)[0]
+        rolloff = librosa.feature.spectral_rolloff(S=S, sr=sr, n_fft=n_fft, hop_length=hop)[0]
+        if beat_fut is None:
+            tempo, beat_frames = 0.0, np.empty(0, dtype=int)
+        else:
+            tempo, beat_frames = beat_fut.result()
+        chroma = chroma_fut.result()
+
+        spectrograms_fut = pool.submit(
+            generate_spectrograms, filepath, y=y, sr=sr, S=S, chroma=chroma, log_mel=log_mel,
+        ) if spectrograms else None
+        extended_fut = pool.submit(
+            analyze_mir_extended, filepath, y=y, sr=sr, S=S,
+            beat_frames=beat_frames, chroma=chroma, log_mel=log_mel,
+        ) if extended else None
+        time_series_fut = pool.submit(
+            analyze_time_series, filepath, y=y, sr=sr, beat_frames=beat_frames,
+            rms=rms, centroid=centroid, chroma=chroma,
+        ) if time_series else None
+
+        result = {"file": filepath}
+        result["librosa"] = analyze_with_librosa(
+            filepath, y=y, sr=sr, S=S, tempo=tempo, rms=rms,
+            centroid=centroid, rolloff=rolloff, chroma=chroma, log_mel=log_mel,
+        )
+
+        if spectrograms_fut is not None:
+            result["spectrograms"] = spectrograms_fut.result()
+
+        if time_series_fut is not None:
+            result["time_series"] = time_series_fut.result()
+
+        if extended_fut is not None:
+            result["extended"] = extended_fut.result()
+
+        if essentia_fut is not None:
+            result["essentia"] = essentia_fut.result()
 
     if qualitative:
         result["qualitative"] = analyze_qualitative(result)
@@ -506,8 +798,16 @@ def full_analysis(filepath: str, time_series=False, spectrograms=False,
     return result
 
 
-def analyze_with_essentia(filepath: str) -> dict:
-    audio = es.MonoLoader(filename=filepath)()
+def analyze_with_essentia(filepath: str, y=None, sr=None) -> dict:
+    if y is None or sr is None:
+        audio = es.MonoLoader(filename=filepath, sampleRate=_ESSENTIA_SR)()
+    else:
+        # Reuse the already-decoded signal; essentia's rhythm/key extractors
+        # assume 44.1 kHz input, so resample (a no-op for 44.1 kHz captures)
+        # rather than decode again.
+        if sr != _ESSENTIA_SR:
+            y = librosa.resample(y, orig_sr=sr, target_sr=_ESSENTIA_SR)
+        audio = np.ascontiguousarray(y, dtype=np.float32)
 
     rhythm_extractor = es.RhythmExtractor2013(method="multifeature")
     bpm, beats, beats_confidence, _, _ = rhythm_extractor(audio)
@@ -531,22 +831,26 @@ def analyze_with_essentia(filepath: str) -> dict:
     }
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: analyze.py <audio_file>", file=sys.stderr)
-        sys.exit(1)
-
-    filepath = sys.argv[1]
+def basic_analysis(filepath: str) -> dict:
+    """Default (flagless) analysis: decodes once, runs every available backend."""
     result = {"file": filepath}
 
-    if HAS_LIBROSA:
-        result["librosa"] = analyze_with_librosa(filepath)
-    if HAS_ESSENTIA:
-        result["essentia"] = analyze_with_essentia(filepath)
     if not HAS_LIBROSA and not HAS_ESSENTIA:
         result["error"] = "No analysis library available. Install: pip install librosa"
+        return result
+
+    if HAS_LIBROSA:
+        return full_analysis(filepath)
+    result["essentia"] = analyze_with_essentia(filepath)
+    return result
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: analyze.py <audio_file>", file=sys.stderr)
+        sys.exit(1)
 
-    print(json.dumps(result, indent=2))
+    print(to_json(basic_analysis(sys.argv[1])))
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@ These remain subprocess calls since the tools are GPL/LGPL —
 we invoke them as separate processes, which is license-compatible.
 """
 
+import functools
 import os
 import shutil
 import subprocess
@@ -21,11 +22,21 @@ def _outfile() -> Path:
     return _capture_dir() / f"capture_{int(time.time())}.wav"
 
 
+@functools.lru_cache(maxsize=1)
+def _capture_tool() -> str | None:
+    """First available capture tool, looked up on PATH once per process."""
+    for tool in ("ffmpeg", "sox", "jack_capture"):
+        if shutil.which(tool):
+            return tool
+    return None
+
+
 def capture_seconds(duration: float) -> Path:
     """Capture audio for a given number of seconds. Returns path to WAV file."""
     outfile = _outfile()
+    tool = _capture_tool()
 
-    if shutil.which("ffmpeg"):
+    if tool == "ffmpeg":
         # macOS: capture from BlackHole virtual audio device
         subprocess.run(
             [
@@ -37,12 +48,12 @@ def capture_seconds(duration: float) -> Path:
             ],
             check=True,
         )
-    elif shutil.which("sox"):
+    elif tool == "sox":
         subprocess.run(
             ["sox", "-d", "-c", "2", str(outfile), "trim", "0", str(duration)],
             check=True,
         )
-    elif shutil.which("jack_capture"):
+    elif tool == "jack_capture":
         subprocess.run(
             ["jack_capture", "--duration", str(duration), str(outfile)],
             check=True,
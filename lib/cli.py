@@ -10,112 +10,129 @@ Controls Ableton via:
 No GPL dependencies are linked — all vendorable libs are MIT/ISC/BSD/Unlicense.
 """
 
-import json
-import signal
+import os
 import sys
 from pathlib import Path
 
-from . import link, osc, midi_engine, capture
-
 
 def cmd_status(_args):
+    from . import link
     print(link.status())
 
 
 def cmd_tempo(args):
+    from . import link
     bpm = _require_arg(args, 0, "tempo <bpm>")
     link.set_tempo(float(bpm))
 
 
 def cmd_start(_args):
+    from . import link
     link.start()
 
 
 def cmd_stop(_args):
+    from . import link
     link.stop()
 
 
 # ── OSC commands ──────────────────────────────────────────
 
 def cmd_play(_args):
+    from . import osc
     osc.play()
 
 
 def cmd_pause(_args):
+    from . import osc
     osc.stop()
 
 
 def cmd_set_tempo(args):
+    from . import osc
     bpm = _require_arg(args, 0, "set-tempo <bpm>")
     osc.set_tempo(float(bpm))
 
 
 def cmd_fire(args):
+    from . import osc
     track = _require_arg(args, 0, "fire <track> <clip>")
     clip = _require_arg(args, 1, "fire <track> <clip>")
     osc.fire_clip(int(track), int(clip))
 
 
 def cmd_stop_clip(args):
+    from . import osc
     track = _require_arg(args, 0, "stop-clip <track> <clip>")
     clip = _require_arg(args, 1, "stop-clip <track> <clip>")
     osc.stop_clip(int(track), int(clip))
 
 
 def cmd_fire_scene(args):
+    from . import osc
     scene = _require_arg(args, 0, "fire-scene <scene>")
     osc.fire_scene(int(scene))
 
 
 def cmd_set_scene_name(args):
+    from . import osc
     scene = _require_arg(args, 0, "set-scene-name <scene> <name>")
     name = _require_arg(args, 1, "set-scene-name <scene> <name>")
     osc.set_scene_name(int(scene), name)
 
 
 def cmd_mute(args):
+    from . import osc
     track = _require_arg(args, 0, "mute <track>")
     osc.mute(int(track))
 
 
 def cmd_unmute(args):
+    from . import osc
     track = _require_arg(args, 0, "unmute <track>")
     osc.unmute(int(track))
 
 
 def cmd_solo(args):
+    from . import osc
     track = _require_arg(args, 0, "solo <track>")
     osc.solo(int(track))
 
 
 def cmd_unsolo(args):
+    from . import osc
     track = _require_arg(args, 0, "unsolo <track>")
     osc.unsolo(int(track))
 
 
 def cmd_volume(args):
+    from . import osc
     track = _require_arg(args, 0, "volume <track> <level>")
     level = _require_arg(args, 1, "volume <track> <level 0.0-1.0>")
     osc.set_volume(int(track), float(level))
 
 
 def cmd_pan(args):
+    from . import osc
     track = _require_arg(args, 0, "pan <track> <value>")
     value = _require_arg(args, 1, "pan <track> <value -1.0 to 1.0>")
     osc.set_pan(int(track), float(value))
 
 
 def cmd_arm(args):
+    from . import osc
     track = _require_arg(args, 0, "arm <track>")
     osc.arm(int(track))
 
 
 def cmd_disarm(args):
+    from . import osc
     track = _require_arg(args, 0, "disarm <track>")
     osc.disarm(int(track))
 
 
 def cmd_device_param(args):
+    from . import osc
     track = _require_arg(args, 0, "device-param <track> <device> <param> <value>")
     device = _require_arg(args, 1, "device-param <track> <device> <param> <value>")
     param = _require_arg(args, 2, "device-param <track> <device> <param> <value>")
@@ -126,27 +143,32 @@ def cmd_device_param(args):
 # ── Track/Clip creation ────────────────────────────────────
 
 def cmd_create_midi_track(args):
+    from . import osc
     index = int(args[0]) if args else -1
     osc.create_midi_track(index)
 
 
 def cmd_create_audio_track(args):
+    from . import osc
     index = int(args[0]) if args else -1
     osc.create_audio_track(index)
 
 
 def cmd_delete_track(args):
+    from . import osc
     track = _require_arg(args, 0, "delete-track <track>")
     osc.delete_track(int(track))
 
 
 def cmd_set_track_name(args):
+    from . import osc
     track = _require_arg(args, 0, "set-track-name <track> <name>")
     name = _require_arg(args, 1, "set-track-name <track> <name>")
     osc.set_track_name(int(track), name)
 
 
 def cmd_create_clip(args):
+    from . import osc
     track = _require_arg(args, 0, "create-clip <track> <slot> [length_beats]")
     slot = _require_arg(args, 1, "create-clip <track> <slot> [length_beats]")
     length = float(args[2]) if len(args) > 2 else 4.0
@@ -154,12 +176,14 @@ def cmd_create_clip(args):
 
 
 def cmd_delete_clip(args):
+    from . import osc
     track = _require_arg(args, 0, "delete-clip <track> <slot>")
     slot = _require_arg(args, 1, "delete-clip <track> <slot>")
     osc.delete_clip(int(track), int(slot))
 
 
 def cmd_set_clip_name(args):
+    from . import osc
     track = _require_arg(args, 0, "set-clip-name <track> <slot> <name>")
     slot = _require_arg(args, 1, "set-clip-name <track> <slot> <name>")
     name = _require_arg(args, 2, "set-clip-name <track> <slot> <name>")
@@ -168,6 +192,7 @@ def cmd_set_clip_name(args):
 
 def cmd_add_notes(args):
     """Add MIDI notes: add-notes <track> <slot> <pitch:start:dur:vel> ..."""
+    from . import osc
     from .song import parse_note
     track = _require_arg(args, 0, "add-notes <track> <slot> <pitch:start:dur:vel> ...")
     slot = _require_arg(args, 1, "add-notes <track> <slot> <pitch:start:dur:vel> ...")
@@ -185,64 +210,94 @@ def cmd_add_notes(args):
 
 
 def cmd_clear_notes(args):
+    from . import osc
     track = _require_arg(args, 0, "clear-notes <track> <slot>")
     slot = _require_arg(args, 1, "clear-notes <track> <slot>")
     osc.remove_notes(int(track), int(slot))
 
 
 def cmd_osc_send(args):
+    from . import osc
     if len(args) < 1:
         _die("osc <address> [args...]")
     address = args[0]
-    osc_args = []
-    for a in args[1:]:
-        try:
-            osc_args.append(float(a) if "." in a else int(a))
-        except ValueError:
-            osc_args.append(a)
-    osc.send(address, *osc_args)
+    osc.send(address, *(_osc_arg(a) for a in args[1:]))
 
 
 # ── Query ─────────────────────────────────────────────────
 
-def cmd_query(args):
-    from . import query_session
-    q = query_session.AbletonQuery()
+_QUERY_USAGE = "query [session|tracks|track <n>|clips <n>|devices <n>|params <t> [d]]"
+
+
+def _do_query(q, args):
+    """Run one query subcommand against *q*. Raises ValueError if unknown."""
     subcmd = args[0] if args else "session"
 
     if subcmd == "session":
-        result = q.get_session_info()
+        return q.get_session_info()
     elif subcmd == "tracks":
-        result = q.get_all_tracks()
+        return q.get_all_tracks()
     elif subcmd == "track":
         idx = int(args[1]) if len(args) > 1 else 0
-        result = q.get_track_info(idx)
+        return q.get_track_info(idx)
     elif subcmd == "clips":
         idx = int(args[1]) if len(args) > 1 else 0
-        result = q.get_clip_slots(idx)
+        return q.get_clip_slots(idx)
     elif subcmd == "devices":
         idx = int(args[1]) if len(args) > 1 else 0
-        result = q.get_devices(idx)
+        return q.get_devices(idx)
     elif subcmd == "params":
         track_idx = int(args[1]) if len(args) > 1 else 0
         device_idx = int(args[2]) if len(args) > 2 else 0
-        result = q.get_device_params(track_idx, device_idx)
-    else:
-        _die("query [session|tracks|track <n>|clips <n>|devices <n>|params <t> [d]]")
+        return q.get_device_params(track_idx, device_idx)
+    raise ValueError(f"unknown query: {subcmd}")
+
+
+def cmd_query(args):
+    from . import query_session
+    q = query_session.AbletonQuery()
+    try:
+        result = _do_query(q, args)
+    except ValueError:
+        _die(_QUERY_USAGE)
+    finally:
+        q.shutdown()
+
+    print(_dumps(result))
 
-    print(json.dumps(result, indent=2, default=str))
-    q.shutdown()
+
+def cmd_query_shell(_args):
+    """Read query subcommands from stdin, one per line, over a single connection."""
+    from . import query_session
+    q = query_session.AbletonQuery()
+    try:
+        for line in sys.stdin:
+            words = line.split()
+            if not words:
+                continue
+            if words[0] in ("quit", "exit"):
+                break
+            try:
+                result = _do_query(q, words)
+            except ValueError as e:
+                print(f"Error: {e}", file=sys.stderr, flush=True)
+                continue
+            print(_dumps(result), flush=True)
+    finally:
+        q.shutdown()
 
 
 # ── Capture ───────────────────────────────────────────────
 
 def cmd_capture(args):
+    from . import capture
     seconds = _require_arg(args, 0, "capture <seconds>")
     path = capture.capture_seconds(float(seconds))
     print(path)
 
 
 def cmd_capture_bars(args):
+    from . import capture
     bars = int(args[0]) if args else 4
     path = capture.capture_bars(bars)
     print(path)
@@ -250,20 +305,22 @@ def cmd_capture_bars(args):
 
 # ── Analysis ──────────────────────────────────────────────
 
+_ANALYSIS_FLAGS = {
+    "-s": "spectrograms", "--spectrogram": "spectrograms", "--spectrograms": "spectrograms",
+    "-t": "time_series", "--time-series": "time_series",
+    "-e": "extended", "--extended": "extended",
+    "-q": "qualitative", "--qualitative": "qualitative",
+}
+
+
 def _parse_analysis_flags(args):
     """Parse -s/-t/-e/-q flags from args, return (flags_dict, remaining_args)."""
-    flags = {"spectrograms": False, "time_series": False, "extended": False,
-             "qualitative": False}
+    flags = dict.fromkeys(_ANALYSIS_FLAGS.values(), False)
     remaining = []
     for a in args:
-        if a in ("-s", "--spectrogram", "--spectrograms"):
-            flags["spectrograms"] = True
-        elif a in ("-t", "--time-series"):
-            flags["time_series"] = True
-        elif a in ("-e", "--extended"):
-            flags["extended"] = True
-        elif a in ("-q", "--qualitative"):
-            flags["qualitative"] = True
+        key = _ANALYSIS_FLAGS.get(a)
+        if key is not None:
+            flags[key] = True
         else:
             remaining.append(a)
     return flags, remaining
@@ -272,41 +329,43 @@ def _parse_analysis_flags(args):
 def cmd_analyze(args):
     flags, rest = _parse_analysis_flags(args)
     filepath = _require_arg(rest, 0, "analyze [-s] [-t] [-e] <file.wav>")
-    if not Path(filepath).is_file():
-        print(f"Error: File not found: {filepath}", file=sys.stderr)
-        sys.exit(1)
+    _require_file(filepath)
     from . import analyze
 
     if any(flags.values()):
         result = analyze.full_analysis(filepath, **flags)
     else:
-        result = {"file": filepath}
-        if analyze.HAS_LIBROSA:
-            result["librosa"] = analyze.analyze_with_librosa(filepath)
-        if analyze.HAS_ESSENTIA:
-            result["essentia"] = analyze.analyze_with_essentia(filepath)
-        if not analyze.HAS_LIBROSA and not analyze.HAS_ESSENTIA:
-            result["error"] = "No analysis library available. Install: pip install librosa"
-    print(json.dumps(result, indent=2))
+        result = analyze.basic_analysis(filepath)
+    print(analyze.to_json(result, indent=sys.stdout.isatty()))
 
 
 def cmd_spectrogram(args):
     """Generate spectrograms from an existing audio file."""
     filepath = _require_arg(args, 0, "spectrogram <file.wav>")
-    if not Path(filepath).is_file():
-        print(f"Error: File not found: {filepath}", file=sys.stderr)
-        sys.exit(1)
+    _require_file(filepath)
     from . import analyze
     paths = analyze.generate_spectrograms(filepath)
-    print(json.dumps(paths, indent=2))
+    print(analyze.to_json(paths, indent=sys.stdout.isatty()))
 
 
 # ── Listen (capture + analyze) ────────────────────────────
 
 def cmd_listen(args):
+    import threading
+    from . import capture
     flags, rest = _parse_analysis_flags(args)
     bars = float(rest[0]) if rest else 4
+
+    def preload():
+        from . import analyze
+        analyze.preload()
+
+    # Pay the analysis imports (librosa, scipy, ...) and librosa's lazy
+    # submodules while the capture is recording
+    warmup = threading.Thread(target=preload, daemon=True)
+    warmup.start()
     path = capture.capture_bars(bars)
+    warmup.join()
     if not path.is_file():
         return
 
@@ -315,14 +374,8 @@ def cmd_listen(args):
     if any(flags.values()):
         result = analyze.full_analysis(str(path), **flags)
     else:
-        result = {"file": str(path)}
-        if analyze.HAS_LIBROSA:
-            result["librosa"] = analyze.analyze_with_librosa(str(path))
-        if analyze.HAS_ESSENTIA:
-            result["essentia"] = analyze.analyze_with_essentia(str(path))
-        if not analyze.HAS_LIBROSA and not analyze.HAS_ESSENTIA:
-            result["error"] = "No analysis library available."
-    print(json.dumps(result, indent=2))
+        result = analyze.basic_analysis(str(path))
+    print(analyze.to_json(result, indent=sys.stdout.isatty()))
 
 
 # ── Templates ─────────────────────────────────────────────
@@ -347,15 +400,15 @@ def cmd_template(args):
 # ── Procedures ────────────────────────────────────────────
 
 def cmd_probe(args):
-    from . import procedures
+    from . import analyze, procedures
     track = int(_require_arg(args, 0, "probe <track> [bars]"))
     bars = int(args[1]) if len(args) > 1 else 1
     results = procedures.probe_track(track, bars=bars)
-    print(json.dumps(results, indent=2))
+    print(analyze.to_json(results, indent=sys.stdout.isatty()))
 
 
 def cmd_sweep(args):
-    from . import procedures
+    from . import analyze, procedures
     track = int(_require_arg(args, 0, "sweep <track> <device> <param> [start end steps] [bars]"))
     device = int(_require_arg(args, 1, "sweep <track> <device> <param> [start end steps] [bars]"))
     param = int(_require_arg(args, 2, "sweep <track> <device> <param> [start end steps] [bars]"))
@@ -364,15 +417,15 @@ def cmd_sweep(args):
     steps = int(args[5]) if len(args) > 5 else 5
     bars = int(args[6]) if len(args) > 6 else 1
     results = procedures.sweep_parameter(track, device, param, start, end, steps, bars=bars)
-    print(json.dumps(results, indent=2))
+    print(analyze.to_json(results, indent=sys.stdout.isatty()))
 
 
 def cmd_mix_check(args):
-    from . import procedures
+    from . import analyze, procedures
     track_count = int(args[0]) if args else None
     bars = int(args[1]) if len(args) > 1 else 2
     results = procedures.mix_check(track_count=track_count, bars=bars)
-    print(json.dumps(results, indent=2))
+    print(analyze.to_json(results, indent=sys.stdout.isatty()))
 
 
 # ── Monitor ───────────────────────────────────────────────
@@ -383,11 +436,10 @@ def cmd_monitor(args):
 
     if subcmd == "start":
         bars = int(args[1]) if len(args) > 1 else 4
-        print(f"Starting monitor: capturing {bars} bars per cycle", flush=True)
-        print("Press Ctrl-C to stop.", flush=True)
+        print(f"Starting monitor: capturing {bars} bars per cycle\nPress Ctrl-C to stop.", flush=True)
         monitor.start(interval_bars=bars)
         try:
-            signal.pause()
+            monitor.wait()
         except KeyboardInterrupt:
             pass
         finally:
@@ -395,11 +447,13 @@ def cmd_monitor(args):
             print("\nMonitor stopped.", flush=True)
 
     elif subcmd == "latest":
-        result = monitor.latest()
-        if result is None:
+        # The file is compact JSON: echo it verbatim when piped, indent it
+        # for a terminal
+        text = monitor.latest_json()
+        if text is None:
             print("No analysis available yet. Run 'monitor start' first.", file=sys.stderr)
             sys.exit(1)
-        print(json.dumps(result, indent=2))
+        print(_dumps(monitor.latest()) if sys.stdout.isatty() else text)
 
     else:
         print("Usage: ableton-cli monitor <start [bars]|latest>", file=sys.stderr)
@@ -411,6 +465,7 @@ def cmd_monitor(args):
 # ── MIDI ──────────────────────────────────────────────────
 
 def cmd_midi(args):
+    from . import midi_engine
     subcmd = args[0] if args else ""
 
     if subcmd == "list":
@@ -465,11 +520,8 @@ def cmd_validate(args):
     """Validate a YAML song file."""
     from . import song
     filepath = _require_arg(args, 0, "validate <song.yaml>")
-    if not Path(filepath).is_file():
-        print(f"Error: File not found: {filepath}", file=sys.stderr)
-        sys.exit(1)
     try:
-        s = song.load(filepath)
+        s = _load_song(filepath)
     except Exception as e:
         print(f"Error parsing YAML: {e}", file=sys.stderr)
         sys.exit(1)
@@ -487,16 +539,12 @@ def cmd_validate(args):
 def cmd_push(args):
     """Push a YAML song to Ableton via OSC — creates tracks, clips, notes."""
     import time
-    from . import song
+    from . import osc, song
 
     filepath = _require_arg(args, 0, "push <song.yaml> [--clear]")
     clear = "--clear" in args
 
-    if not Path(filepath).is_file():
-        print(f"Error: File not found: {filepath}", file=sys.stderr)
-        sys.exit(1)
-
-    s = song.load(filepath)
+    s = _load_song(filepath)
     errors = song.validate(s)
     if errors:
         print(f"Validation failed:")
@@ -504,73 +552,64 @@ def cmd_push(args):
             print(f"  - {err}")
         sys.exit(1)
 
-    MSG_DELAY = 0.05
-
     print(f"Pushing '{s.name}' ({s.key} @ {s.bpm} BPM) to Ableton...")
 
-    # Set tempo
-    osc.set_tempo(s.bpm)
-    time.sleep(MSG_DELAY)
-
-    if clear:
-        print("  Clearing existing tracks...")
-        for i in range(15, -1, -1):
-            try:
+    # Messages go out as OSC bundles. AbletonOSC applies them in order on
+    # Live's main thread and track creation is synchronous, so tracks can be
+    # named and filled in the same bundle; only the clear gets a pause.
+    with osc.bundle():
+        osc.set_tempo(s.bpm)
+        if clear:
+            print("  Clearing existing tracks...")
+            for i in range(15, -1, -1):
                 osc.delete_track(i)
-                time.sleep(MSG_DELAY)
-            except Exception:
-                pass
+    if clear:
         time.sleep(0.5)
 
-    # Create tracks
     print(f"  Creating {len(s.tracks)} tracks...")
-    for track in s.tracks:
-        osc.create_midi_track(-1)
-        time.sleep(0.1)
-    time.sleep(0.5)
-
-    # Name tracks and set mixer
-    for i, track in enumerate(s.tracks):
-        osc.set_track_name(i, track.name)
-        time.sleep(MSG_DELAY)
-        osc.set_volume(i, track.volume)
-        time.sleep(MSG_DELAY)
-        if track.pan != 0.0:
-            osc.set_pan(i, track.pan)
-            time.sleep(MSG_DELAY)
-
-    # Write clips
     total_clips = 0
-    for i, track in enumerate(s.tracks):
-        if not track.clips:
-            continue
-        for cname, clip in track.clips.items():
-            slot = song.get_clip_slot(clip)
-            # Create clip
-            osc.create_clip(i, slot, clip.length)
-            time.sleep(0.1)
-            # Add notes
-            if clip.notes:
-                note_tuples = [(n.pitch, n.start, n.duration, n.velocity, 0) for n in clip.notes]
-                osc.add_notes(i, slot, note_tuples)
-                time.sleep(MSG_DELAY)
-            # Name clip
-            osc.set_clip_name(i, slot, cname)
-            time.sleep(MSG_DELAY)
-            total_clips += 1
-    print(f"  Wrote {total_clips} clips across {len(s.tracks)} tracks")
-
-    # Name scenes
-    for i, scene in enumerate(s.scenes):
-        osc.set_scene_name(i, scene.name)
-        time.sleep(MSG_DELAY)
+    with osc.bundle():
+        # Create, name and mix each track
+        for i, track in enumerate(s.tracks):
+            osc.create_midi_track(-1)
+            osc.set_track_name(i, track.name)
+            osc.set_volume(i, track.volume)
+            if track.pan != 0.0:
+                osc.set_pan(i, track.pan)
+
+        # Write clips
+        for i, track in enumerate(s.tracks):
+            if not track.clips:
+                continue
+            for cname, clip in track.clips.items():
+                slot = song.get_clip_slot(clip)
+                osc.create_clip(i, slot, clip.length)
+                if clip.notes:
+                    note_tuples = [(n.pitch, n.start, n.duration, n.velocity, 0) for n in clip.notes]
+                    osc.add_notes(i, slot, note_tuples)
+                osc.set_clip_name(i, slot, cname)
+                total_clips += 1
+
+        # Name scenes
+        for i, scene in enumerate(s.scenes):
+            osc.set_scene_name(i, scene.name)
 
+    print(f"  Wrote {total_clips} clips across {len(s.tracks)} tracks")
     print(f"  Named {len(s.scenes)} scenes")
     print(f"\nDone! Add instruments in Ableton, then 'fire-scene 0' to begin.")
     for i, track in enumerate(s.tracks):
         print(f"  Track {i}: {track.name:14s} → {track.instrument}")
 
 
+# flag → (option, converter for its value; None for switches)
+_RENDER_FLAGS = {
+    "--scene": ("scene_idx", int),
+    "--output": ("output", str),
+    "--analyze": ("do_analyze", None),
+    "--full": ("full", None),
+}
+
+
 def cmd_render(args):
     """Render a YAML song to WAV (offline, requires pedalboard)."""
     from . import render
@@ -581,40 +620,34 @@ def cmd_render(args):
     from . import song
 
     # Parse flags
-    filepath = None
-    scene_idx = None
-    output = None
-    do_analyze = False
-    full = False
+    opts = {"scene_idx": None, "output": None, "do_analyze": False, "full": False}
     remaining = []
 
-    i = 0
-    while i < len(args):
-        if args[i] == "--scene" and i + 1 < len(args):
-            scene_idx = int(args[i + 1])
-            i += 2
-        elif args[i] == "--output" and i + 1 < len(args):
-            output = args[i + 1]
-            i += 2
-        elif args[i] == "--analyze":
-            do_analyze = True
-            i += 1
-        elif args[i] == "--full":
-            full = True
-            i += 1
+    it = iter(args)
+    for a in it:
+        spec = _RENDER_FLAGS.get(a)
+        if spec is None:
+            remaining.append(a)
+            continue
+        key, convert = spec
+        if convert is None:
+            opts[key] = True
+            continue
+        value = next(it, None)
+        if value is None:
+            # Trailing value flag with nothing after it — treat as positional
+            remaining.append(a)
         else:
-            remaining.append(args[i])
-            i += 1
+            opts[key] = convert(value)
+
+    scene_idx, output = opts["scene_idx"], opts["output"]
+    do_analyze, full = opts["do_analyze"], opts["full"]
 
     if not remaining:
         _die("render <song.yaml> [--scene N] [--full] [--output path] [--analyze]")
     filepath = remaining[0]
 
-    if not Path(filepath).is_file():
-        print(f"Error: File not found: {filepath}", file=sys.stderr)
-        sys.exit(1)
-
-    s = song.load(filepath)
+    s = _load_song(filepath)
     errors = song.validate(s)
     if errors:
         print(f"Validation failed:")
@@ -632,8 +665,9 @@ def cmd_render(args):
         audio = render.render_scene(s, scene_idx, sr=sr)
         default_name = f"{Path(filepath).stem}_scene{scene_idx}.wav"
     elif full:
+        # Streamed to disk scene by scene below rather than held in memory
         print(f"Rendering full arrangement ({len(s.arrangement)} scenes)...")
-        audio = render.render_arrangement(s, sr=sr)
+        audio = None
         default_name = f"{Path(filepath).stem}_full.wav"
     else:
         # Default: render first scene
@@ -643,13 +677,16 @@ def cmd_render(args):
 
     out_path = output or str(Path("captures") / default_name)
     Path(out_path).parent.mkdir(parents=True, exist_ok=True)
-    render.render_to_file(audio, out_path, sr=sr)
+    if audio is None:
+        render.render_arrangement_to_file(s, out_path, sr=sr)
+    else:
+        render.render_to_file(audio, out_path, sr=sr)
     print(f"Rendered to {out_path}")
 
     if do_analyze:
         from . import analyze
         result = analyze.full_analysis(out_path, spectrograms=True, extended=True)
-        print(json.dumps(result, indent=2))
+        print(analyze.to_json(result, indent=sys.stdout.isatty()))
 
 
 def cmd_export(args):
@@ -665,12 +702,66 @@ def cmd_export(args):
 
 # ── Helpers ───────────────────────────────────────────────
 
+def _dumps(result):
+    """JSON for stdout: indented on a terminal, compact when piped.
+
+    Uses orjson when it is installed, like analyze.to_json.
+    """
+    indent = sys.stdout.isatty()
+    try:
+        import orjson
+    except ImportError:
+        import json
+        if indent:
+            return json.dumps(result, indent=2, default=str)
+        return json.dumps(result, separators=(",", ":"), default=str)
+    return orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+
+
 def _require_arg(args, index, usage_hint):
     if index >= len(args):
         _die(usage_hint)
     return args[index]
 
 
+def _require_file(filepath):
+    """Exit with the CLI's not-found error unless *filepath* is a regular file."""
+    if not os.path.isfile(filepath):
+        print(f"Error: File not found: {filepath}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _osc_arg(a):
+    """Type a raw CLI token: float if it has a '.' and parses, int if it parses, else str.
+
+    Plain integers and decimals are recognised with str checks, and tokens
+    with no digits (addresses, names) are strings outright; the rest
+    ("1.5e3", "1_000", ...) go through float()/int() as they always have.
+    """
+    body = a[1:] if a[:1] in ("-", "+") else a
+    if body.isdecimal():
+        return int(a)
+    head, dot, tail = body.partition(".")
+    if dot and (head + tail).isdecimal():
+        return float(a)
+    if not any(c.isdigit() for c in a):
+        return a
+    try:
+        return float(a) if "." in a else int(a)
+    except ValueError:
+        return a
+
+
+def _load_song(filepath):
+    """song.load, reporting a missing file the CLI way (opens once, no pre-stat)."""
+    from . import song
+    try:
+        return song.load(filepath)
+    except (FileNotFoundError, IsADirectoryError):
+        print(f"Error: File not found: {filepath}", file=sys.stderr)
+        sys.exit(1)
+
+
 def _die(usage_hint):
     print(f"Usage: ableton-cli {usage_hint}", file=sys.stderr)
     sys.exit(1)
@@ -716,6 +807,7 @@ COMMANDS = {
     "osc": cmd_osc_send,
     # Query
     "query": cmd_query,
+    "query-shell": cmd_query_shell,
     # Capture
     "capture": cmd_capture,
     "capture-bars": cmd_capture_bars,
@@ -785,6 +877,8 @@ MIXER:
 
 QUERY:
   query [session|tracks|track <n>|clips <n>|devices <n>]
+  query-shell               Read query subcommands from stdin (one per line)
+                            over one OSC connection; 'quit' or EOF ends
 
 CAPTURE:
   capture <seconds>         Capture N seconds of audio
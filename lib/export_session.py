@@ -38,8 +38,12 @@ def export_session(include_notes: bool = True) -> Song:
         num_tracks_raw = session.get("num_tracks")
         num_tracks = int(num_tracks_raw[0]) if num_tracks_raw else 0
 
-        for i in range(num_tracks):
-            info = q.get_track_info(i)
+        tracks = q.get_tracks_bulk(
+            range(num_tracks),
+            ("name", "volume", "panning", "devices/name", "clips/name"),
+        )
+
+        for i, info in enumerate(tracks):
             name_raw = info.get("name")
             name = str(name_raw[1]) if name_raw and len(name_raw) > 1 else f"Track {i}"
             vol_raw = info.get("volume")
@@ -48,7 +52,7 @@ def export_session(include_notes: bool = True) -> Song:
             pan = float(pan_raw[1]) if pan_raw and len(pan_raw) > 1 else 0.0
 
             # Get device name as instrument placeholder
-            devices = q.get_devices(i)
+            devices = info.get("devices/name")
             instrument = ""
             if devices and len(devices) > 1:
                 instrument = f"(Ableton) {devices[1]}"
@@ -61,7 +65,7 @@ def export_session(include_notes: bool = True) -> Song:
             )
 
             # Get clips
-            clip_names = q.get_clip_slots(i)
+            clip_names = info.get("clips/name")
             if clip_names and len(clip_names) > 1:
                 for slot_idx, cname in enumerate(clip_names[1:]):
                     if cname and str(cname).strip():
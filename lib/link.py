@@ -4,9 +4,16 @@ Replaces nc shell-outs with stdlib socket calls.
 Carabiner is GPL so we only talk to it over TCP — no vendoring.
 """
 
+import atexit
 import os
-import re
 import socket
+import threading
+
+# One connection per process, shared by every command (see _send), plus the
+# bytes read from it that don't yet end in a newline
+_conn = None
+_buf = bytearray()
+_lock = threading.Lock()
 
 
 def _host():
@@ -17,15 +24,74 @@ def _port():
     return int(os.environ.get("CARABINER_PORT", "17000"))
 
 
-def _send(command: str, timeout: float = 2.0) -> str:
-    """Send a command to Carabiner and return the response."""
+def _connect(timeout: float) -> socket.socket:
+    sock = socket.create_connection((_host(), _port()), timeout=timeout)
+    # Commands are single short lines; send them now rather than waiting on
+    # Nagle to coalesce with a write that never comes
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    return sock
+
+
+def _close():
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
+    _buf.clear()
+
+
+atexit.register(_close)
+
+
+def _drain(sock: socket.socket):
+    """Discard unsolicited status lines Carabiner pushed since the last command."""
+    sock.setblocking(False)
     try:
-        with socket.create_connection((_host(), _port()), timeout=timeout) as sock:
-            sock.sendall((command + "\n").encode())
-            sock.settimeout(timeout)
-            data = sock.recv(4096)
-            return data.decode().strip()
-    except (ConnectionRefusedError, OSError):
+        while chunk := sock.recv(4096):
+            _buf.extend(chunk)
+    except BlockingIOError:
+        pass
+    del _buf[:_buf.rfind(b"\n") + 1]
+
+
+def _readline(sock: socket.socket) -> bytes:
+    """Read one newline-terminated reply, however many segments it spans."""
+    while (end := _buf.find(b"\n")) < 0:
+        chunk = sock.recv(4096)
+        if not chunk:
+            raise ConnectionResetError("Carabiner closed the connection")
+        _buf.extend(chunk)
+    line = bytes(_buf[:end])
+    del _buf[:end + 1]
+    return line
+
+
+def _exchange(sock: socket.socket, command: str, timeout: float) -> str:
+    _drain(sock)
+    sock.settimeout(timeout)
+    sock.sendall((command + "\n").encode())
+    return _readline(sock).decode().strip()
+
+
+def _send(command: str, timeout: float = 2.0) -> str:
+    """Send a command to Carabiner and return the response.
+
+    The TCP connection is opened on first use and kept for the life of the
+    process; if Carabiner dropped it, it is reopened once.
+    """
+    global _conn
+    with _lock:
+        for _ in range(2):
+            try:
+                if _conn is None:
+                    _conn = _connect(timeout)
+                return _exchange(_conn, command, timeout)
+            except (ConnectionResetError, BrokenPipeError):
+                _close()
+            except OSError:
+                _close()
+                return ""
         return ""
 
 
@@ -39,10 +105,14 @@ def status() -> str:
 
 def get_bpm() -> float | None:
     """Extract BPM from Link status."""
-    result = _send("status")
-    match = re.search(r":bpm\s+([\d.]+)", result)
-    if match:
-        return float(match.group(1))
+    # status { :peers 0 :bpm 120.000000 :start ... }
+    _, found, rest = _send("status").partition(":bpm")
+    value = rest.split(None, 1)[:1]
+    if found and value:
+        try:
+            return float(value[0])
+        except ValueError:
+            pass
     return None
 
 
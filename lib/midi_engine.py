@@ -4,6 +4,8 @@ Replaces sendmidi/receivemidi shell-outs with direct Python calls.
 Both mido (MIT) and python-rtmidi (MIT) can be fully vendored.
 """
 
+import atexit
+import functools
 import os
 import time
 import mido
@@ -13,6 +15,19 @@ def _port_name():
     return os.environ.get("MIDI_DEV", "IAC Driver Bus 1")
 
 
+@functools.lru_cache(maxsize=None)
+def _open_output(name: str):
+    # Opening a port creates a CoreMIDI/ALSA client and scans the port list;
+    # do it once per name for the life of the process
+    port = mido.open_output(name)
+    atexit.register(port.close)
+    return port
+
+
+def _out():
+    return _open_output(_port_name())
+
+
 def list_ports():
     """List available MIDI input and output ports."""
     return {
@@ -25,22 +40,22 @@ def list_ports():
 
 def send_note(note: int, velocity: int = 100, duration_ms: int = 500, channel: int = 0):
     """Send a note on/off pair."""
-    with mido.open_output(_port_name()) as port:
-        port.send(mido.Message("note_on", note=note, velocity=velocity, channel=channel))
-        time.sleep(duration_ms / 1000)
-        port.send(mido.Message("note_off", note=note, velocity=0, channel=channel))
+    port = _out()
+    port.send(mido.Message("note_on", note=note, velocity=velocity, channel=channel))
+    time.sleep(duration_ms / 1000)
+    port.send(mido.Message("note_off", note=note, velocity=0, channel=channel))
 
 
 def send_cc(cc: int, value: int, channel: int = 0):
     """Send a CC message."""
-    with mido.open_output(_port_name()) as port:
-        port.send(mido.Message("control_change", control=cc, value=value, channel=channel))
+    port = _out()
+    port.send(mido.Message("control_change", control=cc, value=value, channel=channel))
 
 
 def send_program_change(program: int, channel: int = 0):
     """Send a program change."""
-    with mido.open_output(_port_name()) as port:
-        port.send(mido.Message("program_change", program=program, channel=channel))
+    port = _out()
+    port.send(mido.Message("program_change", program=program, channel=channel))
 
 
 # ── Chords ─────────────────────────────────────────────────
@@ -67,13 +82,17 @@ def send_chord(root: int, chord_type: str = "major", velocity: int = 100,
                          f"Available: {', '.join(CHORD_INTERVALS)}")
 
     notes = [root + i for i in intervals if root + i <= 127]
+    # Build (and validate) every message up front so the chord tones go out
+    # back to back, with nothing but port.send between them
+    note_ons = [mido.Message("note_on", note=n, velocity=velocity, channel=channel) for n in notes]
+    note_offs = [mido.Message("note_off", note=n, velocity=0, channel=channel) for n in notes]
 
-    with mido.open_output(_port_name()) as port:
-        for n in notes:
-            port.send(mido.Message("note_on", note=n, velocity=velocity, channel=channel))
-        time.sleep(duration_ms / 1000)
-        for n in notes:
-            port.send(mido.Message("note_off", note=n, velocity=0, channel=channel))
+    port = _out()
+    for msg in note_ons:
+        port.send(msg)
+    time.sleep(duration_ms / 1000)
+    for msg in note_offs:
+        port.send(msg)
 
 
 # ── Patterns ───────────────────────────────────────────────
@@ -122,16 +141,26 @@ def play_pattern(pattern_name: str, bpm: int = 120, repeats: int = 1, channel: i
     pattern = PATTERNS[pattern_name]
     beat_duration = 60 / bpm
 
-    with mido.open_output(_port_name()) as port:
-        for _ in range(repeats):
-            for note, vel, dur in pattern:
-                if note is not None:
-                    port.send(mido.Message("note_on", note=note, velocity=vel, channel=channel))
-                    time.sleep(beat_duration * dur * 0.9)
-                    port.send(mido.Message("note_off", note=note, velocity=0, channel=channel))
-                    time.sleep(beat_duration * dur * 0.1)
-                else:
-                    time.sleep(beat_duration * dur)
+    port = _out()
+    # Every event is scheduled against one start time, so sleep overshoot and
+    # send latency don't accumulate into tempo drift over long patterns
+    start = time.monotonic()
+    beat = 0.0
+    for _ in range(repeats):
+        for note, vel, dur in pattern:
+            if note is not None:
+                _sleep_until(start + beat * beat_duration)
+                port.send(mido.Message("note_on", note=note, velocity=vel, channel=channel))
+                _sleep_until(start + (beat + dur * 0.9) * beat_duration)
+                port.send(mido.Message("note_off", note=note, velocity=0, channel=channel))
+            beat += dur
+    _sleep_until(start + beat * beat_duration)
+
+
+def _sleep_until(deadline: float):
+    delay = deadline - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
 
 
 def list_patterns() -> dict[str, float]:
@@ -5,12 +5,40 @@ to captures/latest_analysis.json for any process to read.
 """
 
 import json
+import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from . import capture, analyze
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# path -> ((st_mtime_ns, st_size), parsed dict) from the last _load_json
+_parsed: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+
+def _load_json(path: Path) -> dict | None:
+    """Parse *path*, reusing the previous parse while the file is unchanged."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _parsed.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    raw = path.read_bytes()
+    data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+    _parsed[path] = (key, data)
+    return data
+
 
 class AudioMonitor:
     def __init__(self, interval_bars: int = 4, capture_dir: str | None = None):
@@ -19,6 +47,8 @@ class AudioMonitor:
         self.capture_dir.mkdir(parents=True, exist_ok=True)
         self._stop_event = threading.Event()
         self._thread = None
+        # The loop and the analysis worker can both write the output file
+        self._write_lock = threading.Lock()
 
     def start(self):
         """Spawn daemon thread running the capture→analyze loop."""
@@ -33,34 +63,63 @@ class AudioMonitor:
             self._thread.join(timeout=30)
             self._thread = None
 
+    def wait(self):
+        """Block until the loop thread exits (Ctrl-C still interrupts)."""
+        if self._thread is not None:
+            self._thread.join()
+
     def _loop(self):
-        while not self._stop_event.is_set():
-            try:
-                path = capture.capture_bars(self.interval_bars)
-                result = analyze.full_analysis(
-                    str(path), time_series=True, spectrograms=True,
-                )
-                result["timestamp"] = time.time()
-                result["bars"] = self.interval_bars
-
-                out = self.capture_dir / "latest_analysis.json"
-                out.write_text(json.dumps(result, indent=2))
-            except Exception as e:
-                # Write error to the JSON so callers can see what went wrong
-                out = self.capture_dir / "latest_analysis.json"
-                out.write_text(json.dumps({
-                    "error": str(e),
-                    "timestamp": time.time(),
-                }, indent=2))
-                # Brief pause before retrying after error
-                time.sleep(2)
+        # Each capture is analyzed on a worker while the next one records, so
+        # consecutive captures aren't separated by the analysis time. At most
+        # one analysis is in flight.
+        pending = None
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            while not self._stop_event.is_set():
+                try:
+                    path = capture.capture_bars(self.interval_bars)
+                except Exception as e:
+                    self._write_error(e)
+                    # Brief pause before retrying after error
+                    time.sleep(2)
+                    continue
+                if pending is not None:
+                    pending.result()
+                pending = pool.submit(self._analyze, path)
+
+    def _analyze(self, path: Path):
+        try:
+            result = analyze.full_analysis(
+                str(path), time_series=True, spectrograms=True,
+            )
+            result["timestamp"] = time.time()
+            result["bars"] = self.interval_bars
+
+            # Compact: the file is read by programs; `monitor latest` indents
+            # it for a terminal
+            self._write(analyze.to_json(result, indent=False))
+        except Exception as e:
+            self._write_error(e)
+
+    def _write_error(self, e: Exception):
+        # Write error to the JSON so callers can see what went wrong
+        self._write(json.dumps({
+            "error": str(e),
+            "timestamp": time.time(),
+        }))
+
+    def _write(self, text: str):
+        # Write beside the target and rename over it, so readers in any
+        # process see either the previous result or the new one, never a
+        # half-written file
+        out = self.capture_dir / "latest_analysis.json"
+        tmp = out.with_name(out.name + ".tmp")
+        with self._write_lock:
+            tmp.write_text(text)
+            os.replace(tmp, out)
 
     def latest(self) -> dict | None:
-        """Read and return the latest analysis JSON."""
-        out = self.capture_dir / "latest_analysis.json"
-        if out.is_file():
-            return json.loads(out.read_text())
-        return None
+        """Return the latest analysis JSON (re-parsed only when it changes)."""
+        return _load_json(self.capture_dir / "latest_analysis.json")
 
 
 # Module-level singleton API
@@ -75,6 +134,11 @@ def start(interval_bars: int = 4):
     _monitor.start()
 
 
+def wait():
+    if _monitor is not None:
+        _monitor.wait()
+
+
 def stop():
     global _monitor
     if _monitor is not None:
@@ -82,9 +146,18 @@ def stop():
         _monitor = None
 
 
-def latest() -> dict | None:
-    """Read latest_analysis.json from captures/ (works from any process)."""
+def latest_json() -> str | None:
+    """Raw text of captures/latest_analysis.json (works from any process)."""
     path = Path("captures") / "latest_analysis.json"
-    if path.is_file():
-        return json.loads(path.read_text())
-    return None
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        return None
+
+
+def latest() -> dict | None:
+    """Parsed latest_analysis.json from captures/ (works from any process).
+
+    The parse is cached until the file changes; treat the dict as read-only.
+    """
+    return _load_json(Path("captures") / "latest_analysis.json")
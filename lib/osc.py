@@ -4,14 +4,105 @@ Replaces oscsend shell-outs with direct python-osc calls.
 All Ableton Live Object Model operations go through here.
 """
 
+import functools
 import os
+import socket
+import threading
+from contextlib import contextmanager
+
+from pythonosc.osc_bundle_builder import IMMEDIATELY, OscBundleBuilder
+from pythonosc.osc_message_builder import OscMessageBuilder
 from pythonosc.udp_client import SimpleUDPClient
 
+# Stay under AbletonOSC's 64 KiB receive buffer when packing bundles
+_MAX_BUNDLE_BYTES = 60000
+
+# Send buffer for the UDP socket; must exceed _MAX_BUNDLE_BYTES
+_SEND_BUFFER_BYTES = 1 << 20
+
+# How long a send may wait for room in a full send buffer
+_SEND_TIMEOUT = 2.0
+
+# ~25 bytes per note on the wire, so one add/notes message stays well inside
+# a bundle datagram
+_NOTES_PER_MESSAGE = 1000
+
+_local = threading.local()
+
+
+class _Batch:
+    """Stand-in client that collects messages instead of sending them."""
+
+    def __init__(self):
+        self.messages = []
+
+    def send_message(self, address: str, value):
+        builder = OscMessageBuilder(address=address)
+        for arg in value:
+            builder.add_arg(arg)
+        self.messages.append(builder.build())
+
+
+@functools.lru_cache(maxsize=None)
+def _udp_client(host: str, port: int) -> SimpleUDPClient:
+    # One socket per destination for the life of the process, instead of a
+    # getaddrinfo + new fd on every message
+    client = SimpleUDPClient(host, port)
+    # The socket is python-osc's private attribute; if a release renames it,
+    # send with python-osc's defaults rather than failing every command
+    sock = getattr(client, "_sock", None)
+    if isinstance(sock, socket.socket):
+        # macOS refuses datagrams larger than the socket's send buffer (9216
+        # bytes by default), which a full bundle is
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SEND_BUFFER_BYTES)
+        # python-osc leaves the socket non-blocking, so a send buffer that is
+        # momentarily full would raise BlockingIOError out of a big push; with
+        # a timeout, sendto waits (select-style, in the kernel) for room instead
+        sock.settimeout(_SEND_TIMEOUT)
+    return client
+
 
 def _client():
+    batch = getattr(_local, "batch", None)
+    if batch is not None:
+        return batch
     host = os.environ.get("OSC_HOST", "127.0.0.1")
     port = int(os.environ.get("OSC_PORT", "11000"))
-    return SimpleUDPClient(host, port)
+    return _udp_client(host, port)
+
+
+@contextmanager
+def bundle():
+    """Collect every call made inside the block and send them as OSC bundles.
+
+    Messages keep their order and go out on exit in as few datagrams as fit
+    under _MAX_BUNDLE_BYTES — one sendto per bundle instead of per message.
+    Nothing is sent if the block raises. Nested blocks join the outer one.
+    """
+    if getattr(_local, "batch", None) is not None:
+        yield
+        return
+    batch = _Batch()
+    _local.batch = batch
+    try:
+        yield
+    finally:
+        _local.batch = None
+    send_bundle(batch.messages)
+
+
+def send_bundle(messages):
+    """Send built OscMessages as immediate bundles, split to fit one datagram each."""
+    client = _client()
+    builder, size = OscBundleBuilder(IMMEDIATELY), 16  # "#bundle\0" + timetag
+    for msg in messages:
+        if size + 4 + msg.size > _MAX_BUNDLE_BYTES and size > 16:
+            client.send(builder.build())
+            builder, size = OscBundleBuilder(IMMEDIATELY), 16
+        builder.add_content(msg)
+        size += 4 + msg.size
+    if size > 16:
+        client.send(builder.build())
 
 
 # ── Transport ──────────────────────────────────────────────
@@ -72,11 +163,17 @@ def add_notes(track: int, slot: int, notes: list[tuple[int, float, float, int, i
 
     Each note is (pitch, start_beat, duration_beats, velocity, mute).
     mute: 0 = normal, 1 = muted.
+
+    Large note lists are split across several messages sent as one bundle,
+    so no single datagram outgrows AbletonOSC's receive buffer.
     """
-    flat = [int(track), int(slot)]
-    for pitch, start, dur, vel, muted in notes:
-        flat.extend([int(pitch), float(start), float(dur), int(vel), int(muted)])
-    _client().send_message("/live/clip/add/notes", flat)
+    notes = list(notes)
+    with bundle():
+        for i in range(0, max(len(notes), 1), _NOTES_PER_MESSAGE):
+            flat = [int(track), int(slot)]
+            for pitch, start, dur, vel, muted in notes[i:i + _NOTES_PER_MESSAGE]:
+                flat.extend([int(pitch), float(start), float(dur), int(vel), int(muted)])
+            _client().send_message("/live/clip/add/notes", flat)
 
 
 def remove_notes(track: int, slot: int):
@@ -3,9 +3,14 @@
 probe_track: map the sounds available on a track across note ranges
 sweep_parameter: test a device parameter at multiple values
 mix_check: per-track solo/capture/analyze pass
+
+Each capture is analyzed on a worker thread while the next step sets up and
+records, so a run costs roughly the capture time instead of capture +
+analysis per step.
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from . import osc, capture, analyze
 
@@ -20,50 +25,77 @@ def probe_track(track: int, note_ranges=None, bars: int = 1) -> list[dict]:
         note_ranges = [(i, i + 11) for i in range(24, 85, 12)]
 
     slot = 127  # Use high clip slot for temp clips
-    results = []
+    pending = []
 
+    # AbletonOSC applies each bundle in order on Live's main thread, so a clip
+    # can be created, filled and fired in one go; only the launch is awaited
+    q = _query_or_none()
     osc.solo(track)
-    time.sleep(0.2)
-
-    try:
-        for low, high in note_ranges:
-            # Create temp clip long enough for the notes
-            length_beats = bars * 4
-            osc.create_clip(track, slot, float(length_beats))
-            time.sleep(0.1)
 
-            # Fill with chromatic notes across the range
-            notes = []
-            note_count = high - low + 1
-            dur = length_beats / max(note_count, 1)
-            for j, pitch in enumerate(range(low, high + 1)):
-                notes.append((pitch, j * dur, dur * 0.9, 100, 0))
-            osc.add_notes(track, slot, notes)
-            time.sleep(0.1)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        try:
+            for low, high in note_ranges:
+                # Create temp clip long enough for the notes
+                length_beats = bars * 4
+
+                # Fill with chromatic notes across the range
+                notes = []
+                note_count = high - low + 1
+                dur = length_beats / max(note_count, 1)
+                for j, pitch in enumerate(range(low, high + 1)):
+                    notes.append((pitch, j * dur, dur * 0.9, 100, 0))
+
+                # Fire clip, capture, analyze
+                with osc.bundle():
+                    osc.create_clip(track, slot, float(length_beats))
+                    osc.add_notes(track, slot, notes)
+                    osc.fire_clip(track, slot)
+                _wait_playing(q, track, slot)
+                path = capture.capture_bars(bars)
+
+                fut = pool.submit(analyze.full_analysis, str(path), spectrograms=True, extended=True)
+                pending.append((low, high, fut))
+
+                # Clean up temp clip
+                with osc.bundle():
+                    osc.stop_clip(track, slot)
+                    osc.delete_clip(track, slot)
+        finally:
+            osc.unsolo(track)
+            if q is not None:
+                q.shutdown()
 
-            # Fire clip, capture, analyze
-            osc.fire_clip(track, slot)
-            time.sleep(0.3)  # Let clip start
-            path = capture.capture_bars(bars)
-            osc.stop_clip(track, slot)
-            time.sleep(0.1)
+    results = []
+    for low, high, fut in pending:
+        analysis = fut.result()
+        results.append({
+            "note_range": f"{low}-{high}",
+            "note_range_names": f"MIDI {low}-{high}",
+            "analysis": analysis,
+            "spectrograms": analysis.get("spectrograms", {}),
+        })
+    return results
 
-            analysis = analyze.full_analysis(str(path), spectrograms=True, extended=True)
 
-            # Clean up temp clip
-            osc.delete_clip(track, slot)
-            time.sleep(0.1)
+def _query_or_none():
+    """An AbletonQuery for confirmations, or None if its reply port is taken."""
+    from . import query_session
+    try:
+        return query_session.AbletonQuery()
+    except OSError:
+        return None
 
-            results.append({
-                "note_range": f"{low}-{high}",
-                "note_range_names": f"MIDI {low}-{high}",
-                "analysis": analysis,
-                "spectrograms": analysis.get("spectrograms", {}),
-            })
-    finally:
-        osc.unsolo(track)
 
-    return results
+def _wait_playing(q, track: int, slot: int, timeout: float = 0.3):
+    """Return once the clip reports playing, or after *timeout* either way."""
+    deadline = time.monotonic() + timeout
+    if q is not None:
+        while (remaining := deadline - time.monotonic()) > 0:
+            reply = q.query("/live/clip/get/is_playing", track, slot, timeout=remaining)
+            if reply and reply[-1]:
+                return
+            time.sleep(0.01)
+    time.sleep(max(deadline - time.monotonic(), 0))
 
 
 def sweep_parameter(
@@ -75,22 +107,21 @@ def sweep_parameter(
 
     Returns list of {param_value, analysis} per step.
     """
-    results = []
     values = [start + (end - start) * i / max(steps - 1, 1) for i in range(steps)]
+    pending = []
 
-    for value in values:
-        osc.set_device_param(track, device, param, value)
-        time.sleep(0.3)  # Let parameter settle
-
-        path = capture.capture_bars(bars)
-        analysis = analyze.full_analysis(str(path), spectrograms=True)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        for value in values:
+            osc.set_device_param(track, device, param, value)
+            time.sleep(0.3)  # Let parameter settle
 
-        results.append({
-            "param_value": round(value, 4),
-            "analysis": analysis,
-        })
+            path = capture.capture_bars(bars)
+            pending.append((value, pool.submit(analyze.full_analysis, str(path), spectrograms=True)))
 
-    return results
+    return [
+        {"param_value": round(value, 4), "analysis": fut.result()}
+        for value, fut in pending
+    ]
 
 
 def mix_check(track_count: int | None = None, bars: int = 2) -> list[dict]:
@@ -110,20 +141,18 @@ def mix_check(track_count: int | None = None, bars: int = 2) -> list[dict]:
         else:
             raise RuntimeError("Could not determine track count from session")
 
-    results = []
-    for i in range(track_count):
-        osc.solo(i)
-        time.sleep(0.3)
+    pending = []
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        for i in range(track_count):
+            osc.solo(i)
+            time.sleep(0.3)
 
-        path = capture.capture_bars(bars)
-        analysis = analyze.full_analysis(str(path), spectrograms=True, time_series=True)
-
-        osc.unsolo(i)
-        time.sleep(0.1)
+            path = capture.capture_bars(bars)
+            pending.append(pool.submit(
+                analyze.full_analysis, str(path), spectrograms=True, time_series=True,
+            ))
 
-        results.append({
-            "track": i,
-            "analysis": analysis,
-        })
+            osc.unsolo(i)
+            time.sleep(0.1)
 
-    return results
+    return [{"track": i, "analysis": fut.result()} for i, fut in enumerate(pending)]
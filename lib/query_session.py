@@ -5,67 +5,133 @@ Returns JSON describing the current session: tempo, tracks, clips, devices.
 """
 
 import json
+import socket
 import sys
-import time
 import threading
+from pythonosc.osc_bundle_builder import IMMEDIATELY, OscBundleBuilder
+from pythonosc.osc_message_builder import OscMessageBuilder
 from pythonosc.udp_client import SimpleUDPClient
 from pythonosc.dispatcher import Dispatcher
 from pythonosc.osc_server import BlockingOSCUDPServer
 
+# Receive buffer for the reply socket
+_RECV_BUFFER_BYTES = 1 << 20
+
+# query_many sends its requests as OSC bundles of this many messages: a few
+# KB per datagram, inside macOS's default 9 KB UDP datagram limit
+_REQUESTS_PER_BUNDLE = 64
+
+# Fields get_track_info reports for each track
+_TRACK_FIELDS = ("name", "volume", "panning", "mute", "solo", "arm")
+
 
 class AbletonQuery:
     def __init__(self, host="127.0.0.1", send_port=11000, recv_port=11001):
         self.client = SimpleUDPClient(host, send_port)
         self.responses = {}
+        # Notified by the server thread whenever a reply lands in self.responses
+        self._arrived = threading.Condition()
 
         self.dispatcher = Dispatcher()
         self.dispatcher.set_default_handler(self._handle_response)
         self.server = BlockingOSCUDPServer((host, recv_port), self.dispatcher)
-
-        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        # query_many can have hundreds of replies in flight at once; give them
+        # room to queue (macOS defaults to ~40 KB) instead of being dropped
+        self.server.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RECV_BUFFER_BYTES)
+
+        # serve_forever checks for shutdown() once per poll_interval; keep that
+        # short so shutting down doesn't cost the default half second
+        self.server_thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.05}
+        )
         self.server_thread.daemon = True
         self.server_thread.start()
 
     def _handle_response(self, address, *args):
-        self.responses[address] = args
+        with self._arrived:
+            self.responses[address] = args
+            if args:
+                # Per-object replies echo the track index first; key on it too so
+                # the same address can be in flight for many tracks at once
+                self.responses[(address, args[0])] = args
+            self._arrived.notify_all()
+
+    def _collect(self, keys, timeout):
+        """Wait for a reply to every key and return them (None where none came).
+
+        *timeout* bounds the wait for the next reply, not the whole batch, so a
+        long burst that Live answers one by one isn't cut off mid-stream.
+        """
+        with self._arrived:
+            pending = [k for k in keys if k not in self.responses]
+            while pending and self._arrived.wait(timeout):
+                pending = [k for k in pending if k not in self.responses]
+            return [self.responses.get(k) for k in keys]
 
     def query(self, address, *args, timeout=0.5):
-        self.responses.pop(address, None)
+        with self._arrived:
+            self.responses.pop(address, None)
         self.client.send_message(address, list(args))
-        time.sleep(timeout)
-        return self.responses.get(address)
+        return self._collect([address], timeout)[0]
+
+    def _send_bundled(self, requests):
+        # Bundled, so a burst of hundreds of requests is a handful of
+        # datagrams rather than enough to overrun AbletonOSC's receive buffer
+        for i in range(0, len(requests), _REQUESTS_PER_BUNDLE):
+            bundle = OscBundleBuilder(IMMEDIATELY)
+            for address, *args in requests[i:i + _REQUESTS_PER_BUNDLE]:
+                msg = OscMessageBuilder(address=address)
+                for arg in args:
+                    msg.add_arg(arg)
+                bundle.add_content(msg.build())
+            self.client.send(bundle.build())
+
+    def query_many(self, requests, timeout=0.5):
+        """Send every (address, *args) request, then wait once for all replies.
+
+        Replies are matched on address plus the first argument, so results
+        come back in request order. Requests still unanswered once replies
+        stop arriving are sent once more before giving up on them.
+        """
+        requests = list(requests)
+        keys = [(address, args[0]) if args else address for address, *args in requests]
+        with self._arrived:
+            for key in keys:
+                self.responses.pop(key, None)
+        self._send_bundled(requests)
+        replies = self._collect(keys, timeout)
+        missing = [i for i, reply in enumerate(replies) if reply is None]
+        if missing:
+            self._send_bundled([requests[i] for i in missing])
+            for i, reply in zip(missing, self._collect([keys[i] for i in missing], timeout)):
+                replies[i] = reply
+        return replies
 
     def shutdown(self):
         self.server.shutdown()
+        self.server.server_close()
 
     def get_session_info(self):
-        return {
-            "tempo": self.query("/live/song/get/tempo"),
-            "num_tracks": self.query("/live/song/get/num_tracks"),
-            "num_scenes": self.query("/live/song/get/num_scenes"),
-            "signature_numerator": self.query("/live/song/get/signature_numerator"),
-            "signature_denominator": self.query("/live/song/get/signature_denominator"),
-        }
+        fields = ("tempo", "num_tracks", "num_scenes", "signature_numerator", "signature_denominator")
+        replies = self.query_many([(f"/live/song/get/{field}",) for field in fields])
+        return dict(zip(fields, replies))
 
     def get_track_info(self, track_idx):
-        return {
-            "index": track_idx,
-            "name": self.query("/live/track/get/name", track_idx),
-            "volume": self.query("/live/track/get/volume", track_idx),
-            "panning": self.query("/live/track/get/panning", track_idx),
-            "mute": self.query("/live/track/get/mute", track_idx),
-            "solo": self.query("/live/track/get/solo", track_idx),
-            "arm": self.query("/live/track/get/arm", track_idx),
-        }
+        return self.get_tracks_bulk([track_idx])[0]
+
+    def get_tracks_bulk(self, indices, fields=_TRACK_FIELDS):
+        """Fetch /live/track/get/<field> for every track in one round-trip wait."""
+        indices = list(indices)
+        replies = iter(self.query_many(
+            [(f"/live/track/get/{field}", i) for i in indices for field in fields]
+        ))
+        return [{"index": i, **{field: next(replies) for field in fields}} for i in indices]
 
     def get_all_tracks(self):
         num = self.query("/live/song/get/num_tracks")
         if not num:
             return []
-        tracks = []
-        for i in range(int(num[0])):
-            tracks.append(self.get_track_info(i))
-        return tracks
+        return self.get_tracks_bulk(range(int(num[0])))
 
     def get_clip_slots(self, track_idx):
         return self.query("/live/track/get/clips/name", track_idx)
@@ -75,8 +141,10 @@ class AbletonQuery:
 
     def get_device_params(self, track_idx, device_idx=0):
         """Get parameter names and values for a device."""
-        names = self.query("/live/device/get/parameters/name", track_idx, device_idx)
-        values = self.query("/live/device/get/parameters/value", track_idx, device_idx)
+        names, values = self.query_many([
+            ("/live/device/get/parameters/name", track_idx, device_idx),
+            ("/live/device/get/parameters/value", track_idx, device_idx),
+        ])
         if names and values:
             # First two elements are track_idx and device_idx
             param_names = [str(n) for n in names[2:]]
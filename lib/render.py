@@ -9,7 +9,11 @@ only when explicitly requested via `render` command or `.[render]` extras.
 
 from __future__ import annotations
 
+import functools
+import os
 import sys
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -38,23 +42,26 @@ def _require_deps():
         sys.exit(1)
 
 
+_NOTE_ON = 0x90  # channel 0
+_NOTE_OFF = 0x80
+
+
 def _notes_to_midi_messages(notes, bpm: float):
-    """Convert Note objects to a list of (time_seconds, message) tuples for pedalboard.
+    """Convert Note objects to pedalboard's raw MIDI events.
 
-    Returns a list of mido Message objects sorted by time.
+    Returns a list of (midi_bytes, time_seconds) tuples sorted by time; raw
+    bytes skip building and validating a mido Message per event.
     """
-    import mido
-
     events = []
     spb = 60.0 / bpm  # seconds per beat
 
     for note in notes:
         on_time = note.start * spb
         off_time = (note.start + note.duration) * spb
-        events.append((on_time, mido.Message("note_on", note=note.pitch, velocity=note.velocity, channel=0)))
-        events.append((off_time, mido.Message("note_off", note=note.pitch, velocity=0, channel=0)))
+        events.append((bytes((_NOTE_ON, note.pitch, note.velocity)), on_time))
+        events.append((bytes((_NOTE_OFF, note.pitch, 0)), off_time))
 
-    events.sort(key=lambda e: e[0])
+    events.sort(key=lambda e: e[1])
     return events
 
 
@@ -73,9 +80,53 @@ def _load_plugin(instrument_path: str, preset: str | None = None):
     return plugin
 
 
-def render_track(track, clip, duration_beats: float, bpm: float, sr: int = 44100) -> np.ndarray:
+@functools.lru_cache(maxsize=32)
+def _cached_plugin(instrument_path: str, preset: str | None, copy: int):
+    """Loaded plugin instance *copy* for an instrument, reused across scenes.
+
+    Tracks sharing an instrument within one scene render at the same time,
+    so each gets its own copy number (and instance); plugins aren't thread-safe.
+    """
+    return _load_plugin(instrument_path, preset)
+
+
+# Rendered track audio keyed by everything that determines it, so a clip
+# repeated across scenes only goes through its plugin once per song
+_RENDER_CACHE_SIZE = 32
+_render_cache: OrderedDict[tuple, np.ndarray] = OrderedDict()
+
+
+def _render_key(track, clip, duration_beats: float, bpm: float, sr: int) -> tuple:
+    notes = tuple((n.pitch, n.start, n.duration, n.velocity) for n in clip.notes)
+    return (track.instrument, track.preset, notes, duration_beats, bpm, sr)
+
+
+def _is_placeholder(track) -> bool:
+    """Ableton-native instruments (or none) can't be rendered offline."""
+    return track.instrument.startswith("(Ableton)") or not track.instrument
+
+
+_silence_buf = np.zeros((2, 0), dtype=np.float32)
+
+
+def _silence(num_samples: int) -> np.ndarray:
+    """Zeroed plugin input of *num_samples*, a view into one shared buffer.
+
+    pedalboard copies its input before processing, so the buffer is only
+    ever read and can be shared between concurrent renders.
+    """
+    global _silence_buf
+    buf = _silence_buf
+    if buf.shape[1] < num_samples:
+        buf = _silence_buf = np.zeros((2, num_samples), dtype=np.float32)
+    return buf[:, :num_samples]
+
+
+def render_track(track, clip, duration_beats: float, bpm: float, sr: int = 44100,
+                 plugin=None) -> np.ndarray:
     """Render a single track+clip to audio via its AU/VST instrument.
 
+    *plugin* is the already-loaded instrument, if the caller has one.
     Returns stereo numpy array of shape (2, num_samples).
     """
     _require_deps()
@@ -85,25 +136,21 @@ def render_track(track, clip, duration_beats: float, bpm: float, sr: int = 44100
     num_samples = int(duration_s * sr)
 
     # Check if instrument is an Ableton placeholder
-    if track.instrument.startswith("(Ableton)") or not track.instrument:
+    if _is_placeholder(track):
         # Can't render Ableton-native instruments — return silence
         print(f"  Skipping '{track.name}' (Ableton-only instrument)", file=sys.stderr)
         return np.zeros((2, num_samples), dtype=np.float32)
 
-    plugin = _load_plugin(track.instrument, track.preset)
+    if plugin is None:
+        plugin = _load_plugin(track.instrument, track.preset)
 
     # Convert notes to MIDI messages
-    events = _notes_to_midi_messages(clip.notes, bpm)
-
-    # Build MIDI message list for pedalboard
-    midi_messages = []
-    for time_s, msg in events:
-        midi_messages.append((time_s, msg))
+    midi_messages = _notes_to_midi_messages(clip.notes, bpm)
 
     # Render through plugin
     # pedalboard's __call__ on instrument plugins accepts MIDI
     audio = plugin(
-        np.zeros((2, num_samples), dtype=np.float32),
+        _silence(num_samples),
         sample_rate=sr,
         midi_messages=midi_messages,
     )
@@ -120,12 +167,15 @@ def render_scene(song, scene_idx: int, sr: int = 44100) -> np.ndarray:
     duration_s = duration_beats * spb
     num_samples = int(duration_s * sr)
 
+    # First track wins on duplicate names
+    tracks_by_name = {t.name: t for t in reversed(song.tracks)}
+    tracks = []
     track_audios = []
-    track_metas = []
-
+    jobs = []
+    copies = Counter()
     for tname, cname in scene.clips.items():
         # Find the track
-        track = next((t for t in song.tracks if t.name == tname), None)
+        track = tracks_by_name.get(tname)
         if track is None:
             print(f"  Warning: track '{tname}' not found, skipping", file=sys.stderr)
             continue
@@ -136,9 +186,43 @@ def render_scene(song, scene_idx: int, sr: int = 44100) -> np.ndarray:
             print(f"  Warning: clip '{cname}' not found on track '{tname}', skipping", file=sys.stderr)
             continue
 
+        tracks.append(track)
+        track_audios.append(None)
+        key = None
+        plugin = None
+        if not _is_placeholder(track):
+            key = _render_key(track, clip, duration_beats, song.bpm, sr)
+            if (audio := _render_cache.get(key)) is not None:
+                _render_cache.move_to_end(key)
+                print(f"  Reusing {tname}: {cname}")
+                track_audios[-1] = audio
+                continue
+
+            # Plugins are instantiated here on the calling thread (some AUs
+            # insist on it); only the rendering itself goes to the pool
+            plugin_key = (track.instrument, track.preset)
+            plugin = _cached_plugin(*plugin_key, copies[plugin_key])
+            copies[plugin_key] += 1
+            plugin.reset()  # drop tails/voices left from its previous render
         print(f"  Rendering {tname}: {cname}...")
-        audio = render_track(track, clip, duration_beats, song.bpm, sr=sr)
+        jobs.append((len(tracks) - 1, track, clip, plugin, key))
+
+    if not tracks:
+        return np.zeros((2, num_samples), dtype=np.float32)
+
+    # pedalboard releases the GIL while a plugin processes, so tracks render
+    # in parallel on threads; map() keeps the results in scene order
+    def render_job(job):
+        _, track, clip, plugin, _ = job
+        return render_track(track, clip, duration_beats, song.bpm, sr=sr, plugin=plugin)
 
+    if jobs:
+        with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+            rendered = list(pool.map(render_job, jobs))
+    else:
+        rendered = []
+
+    for (i, _, _, _, key), audio in zip(jobs, rendered):
         # Ensure correct length (pad or trim)
         if audio.shape[1] < num_samples:
             pad = np.zeros((2, num_samples - audio.shape[1]), dtype=np.float32)
@@ -146,28 +230,33 @@ def render_scene(song, scene_idx: int, sr: int = 44100) -> np.ndarray:
         elif audio.shape[1] > num_samples:
             audio = audio[:, :num_samples]
 
-        track_audios.append(audio)
-        track_metas.append({"volume": track.volume, "pan": track.pan})
-
-    if not track_audios:
-        return np.zeros((2, num_samples), dtype=np.float32)
+        track_audios[i] = audio
+        if key is not None:
+            # mix_tracks only reads its inputs, so the cached array is shared as-is
+            _render_cache[key] = audio
+            if len(_render_cache) > _RENDER_CACHE_SIZE:
+                _render_cache.popitem(last=False)
 
+    track_metas = [{"volume": t.volume, "pan": t.pan} for t in tracks]
     return mix_tracks(track_audios, track_metas, sr=sr)
 
 
-def render_arrangement(song, sr: int = 44100) -> np.ndarray:
-    """Render full arrangement (scene sequence) to audio."""
-    segments = []
+def _arrangement_segments(song, sr: int):
+    """Yield each arranged scene's audio in order, rendered on demand."""
+    # First scene wins on duplicate names
+    scene_index = {s.name: j for j, s in reversed(list(enumerate(song.scenes)))}
     for i, scene_name in enumerate(song.arrangement):
-        scene_idx = next(
-            (j for j, s in enumerate(song.scenes) if s.name == scene_name), None
-        )
+        scene_idx = scene_index.get(scene_name)
         if scene_idx is None:
             print(f"  Warning: scene '{scene_name}' not found, skipping", file=sys.stderr)
             continue
         print(f"Scene {i}: {scene_name}")
-        segment = render_scene(song, scene_idx, sr=sr)
-        segments.append(segment)
+        yield render_scene(song, scene_idx, sr=sr)
+
+
+def render_arrangement(song, sr: int = 44100) -> np.ndarray:
+    """Render full arrangement (scene sequence) to audio."""
+    segments = list(_arrangement_segments(song, sr))
 
     if not segments:
         return np.zeros((2, 0), dtype=np.float32)
@@ -175,43 +264,61 @@ def render_arrangement(song, sr: int = 44100) -> np.ndarray:
     return np.concatenate(segments, axis=1)
 
 
+def render_arrangement_to_file(song, path: str, sr: int = 44100):
+    """Render full arrangement straight to a WAV file, one scene at a time.
+
+    Each scene is written as soon as it is rendered, so only one scene's
+    audio is in memory rather than the whole song (twice, when concatenated).
+    """
+    _require_deps()
+
+    frames = 0
+    with AudioFile(path, "w", samplerate=sr, num_channels=2) as f:
+        for segment in _arrangement_segments(song, sr):
+            f.write(segment)
+            frames += segment.shape[1]
+
+    print(f"  Wrote {path} ({frames / sr:.1f}s, {sr}Hz stereo)")
+
+
 def mix_tracks(track_audios: list[np.ndarray], track_metas: list[dict], sr: int = 44100) -> np.ndarray:
     """Sum tracks with volume scaling + constant-power panning.
 
     Each track_meta has 'volume' (0-1) and 'pan' (-1 to 1, negative = left).
     """
-    import math
-
     if not track_audios:
         return np.zeros((2, 0), dtype=np.float32)
 
-    max_len = max(a.shape[1] for a in track_audios)
-    mix = np.zeros((2, max_len), dtype=np.float64)
-
-    for audio, meta in zip(track_audios, track_metas):
-        vol = meta.get("volume", 0.85)
-        pan = meta.get("pan", 0.0)
-
-        # Constant-power pan: pan in [-1, 1] → angle in [0, pi/2]
-        angle = (pan + 1.0) / 2.0 * (math.pi / 2.0)
-        gain_l = vol * math.cos(angle)
-        gain_r = vol * math.sin(angle)
-
-        # Ensure audio is padded to max_len
-        if audio.shape[1] < max_len:
-            pad = np.zeros((2, max_len - audio.shape[1]), dtype=np.float32)
-            audio = np.concatenate([audio, pad], axis=1)
+    # Constant-power pan for all tracks at once: pan in [-1, 1] → angle in [0, pi/2]
+    vols = np.fromiter((m.get("volume", 0.85) for m in track_metas), dtype=np.float64)
+    pans = np.fromiter((m.get("pan", 0.0) for m in track_metas), dtype=np.float64)
+    angles = (pans + 1.0) * (np.pi / 4.0)
+    # (tracks, 2, 1) so gains[i] broadcasts over a (2, n) track
+    gains = np.stack([vols * np.cos(angles), vols * np.sin(angles)], axis=1)
+    gains = gains.astype(np.float32)[:, :, None]
+
+    if len(track_audios) == 1:
+        # Nothing to sum: scale the lone track straight into the output
+        mix = np.multiply(track_audios[0], gains[0], dtype=np.float32)
+    else:
+        max_len = max(a.shape[1] for a in track_audios)
+        # float32 throughout, and no per-track padding: shorter tracks add into
+        # a view of the mix, via one scratch buffer reused for every track
+        mix = np.zeros((2, max_len), dtype=np.float32)
+        scratch = np.empty_like(mix)
 
-        mix[0] += audio[0] * gain_l
-        mix[1] += audio[1] * gain_r
+        for audio, gain in zip(track_audios, gains):
+            n = audio.shape[1]
+            np.multiply(audio, gain, out=scratch[:, :n])
+            mix[:, :n] += scratch[:, :n]
 
     # Soft-clip to prevent digital clipping
-    peak = np.max(np.abs(mix))
+    peak = max(mix.max(), -mix.min())
     if peak > 1.0:
         mix /= peak
         print(f"  Mix normalized (peak was {peak:.2f})", file=sys.stderr)
 
-    return mix.astype(np.float32)
+    return mix
 
 
 def render_to_file(audio: np.ndarray, path: str, sr: int = 44100):
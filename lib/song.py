@@ -9,6 +9,7 @@ Note format uses the same P:S:D[:V] notation as the CLI:
 
 from __future__ import annotations
 
+import re
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -20,11 +21,16 @@ try:
 except ImportError:
     HAS_YAML = False
 
+if HAS_YAML:
+    # LibYAML's C parser/emitter when pyyaml was built with it
+    _Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    _Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 # ── Data model ────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(frozen=True)
 class Note:
     pitch: int
     start: float  # beats
@@ -36,7 +42,7 @@ class Note:
 class Clip:
     name: str
     length: float  # beats
-    notes: list[Note] = field(default_factory=list)
+    notes: list[Note] | tuple[Note, ...] = field(default_factory=list)  # tuple when shared (see load)
 
 
 @dataclass
@@ -71,6 +77,10 @@ class Song:
 # ── Note parsing ──────────────────────────────────────────
 
 
+# Plain P:S:D[:V]; anything else (signs, exponents, extra fields) takes the slow path
+_NOTE_RE = re.compile(r"(\d+):(\d+(?:\.\d*)?):(\d+(?:\.\d*)?)(?::(\d+))?")
+
+
 def parse_note(s: str) -> Note:
     """Parse P:S:D[:V] string into a Note.
 
@@ -79,6 +89,9 @@ def parse_note(s: str) -> Note:
     >>> parse_note("48:2.5:0.5")
     Note(pitch=48, start=2.5, duration=0.5, velocity=100)
     """
+    if m := _NOTE_RE.fullmatch(s):
+        p, st, d, v = m.groups()
+        return Note(int(p), float(st), float(d), int(v) if v else 100)
     parts = s.split(":")
     if len(parts) < 3:
         raise ValueError(f"note format is pitch:start:duration[:velocity] — got '{s}'")
@@ -111,6 +124,23 @@ def _require_yaml():
         sys.exit(1)
 
 
+def _parse_notes(raw_notes) -> list[Note]:
+    """Parse a list of P:S:D[:V] entries, matching each against the precompiled regex.
+
+    Entries that aren't plain P:S:D[:V] go through parse_note(), so malformed
+    input still gets its error message.
+    """
+    notes = []
+    for n in raw_notes:
+        s = str(n)
+        if m := _NOTE_RE.fullmatch(s):
+            p, st, d, v = m.groups()
+            notes.append(Note(int(p), float(st), float(d), int(v) if v else 100))
+        else:
+            notes.append(parse_note(s))
+    return notes
+
+
 def _parse_clip(name: str, data) -> Clip:
     """Parse a clip from YAML data (dict with length + notes)."""
     if isinstance(data, dict):
@@ -118,7 +148,7 @@ def _parse_clip(name: str, data) -> Clip:
         raw_notes = data.get("notes", [])
     else:
         raise ValueError(f"clip '{name}': expected dict with length and notes")
-    notes = [parse_note(str(n)) for n in raw_notes]
+    notes = _parse_notes(raw_notes)
     return Clip(name=name, length=length, notes=notes)
 
 
@@ -147,7 +177,7 @@ def load(path: str | Path) -> Song:
     _require_yaml()
     path = Path(path)
     with open(path) as f:
-        raw = yaml.safe_load(f)
+        raw = yaml.load(f, Loader=_Loader)
 
     if not isinstance(raw, dict):
         raise ValueError(f"expected YAML mapping, got {type(raw).__name__}")
@@ -167,9 +197,12 @@ def load(path: str | Path) -> Song:
         time_sig=time_sig,
     )
 
-    # Patterns (reusable clip definitions)
+    # Patterns (reusable clip definitions). Their notes are frozen into a
+    # tuple, so every track clip that references a pattern can share it
     for pname, pdata in raw.get("patterns", {}).items():
-        song.patterns[pname] = _parse_clip(pname, pdata)
+        pattern = _parse_clip(pname, pdata)
+        pattern.notes = tuple(pattern.notes)
+        song.patterns[pname] = pattern
 
     # Tracks
     for tdata in raw.get("tracks", []):
@@ -182,8 +215,9 @@ def load(path: str | Path) -> Song:
         )
         for cname, cdata in tdata.get("clips", {}).items():
             clip, slot = _parse_clip_ref(cname, cdata, song.patterns)
-            # Store with slot info embedded in the clip name for push
-            clip_with_slot = Clip(name=cname, length=clip.length, notes=list(clip.notes))
+            # Store with slot info embedded in the clip name for push; pattern
+            # references share the pattern's immutable note tuple
+            clip_with_slot = Clip(name=cname, length=clip.length, notes=clip.notes)
             clip_with_slot._slot = slot  # type: ignore[attr-defined]
             track.clips[cname] = clip_with_slot
         song.tracks.append(track)
@@ -261,14 +295,13 @@ def save(song: Song, path: str | Path):
         data["arrangement"] = song.arrangement
 
     # Register representer to force-quote note strings (avoids YAML sexagesimal)
-    dumper = yaml.Dumper
-    dumper.add_representer(
+    _Dumper.add_representer(
         _QuotedStr,
         lambda d, s: d.represent_scalar("tag:yaml.org,2002:str", str(s), style='"'),
     )
 
     with open(path, "w") as f:
-        yaml.dump(data, f, Dumper=dumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        yaml.dump(data, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
 
 # ── Validation ────────────────────────────────────────────
@@ -283,7 +316,8 @@ def validate(song: Song) -> list[str]:
     if song.bpm <= 0:
         errors.append(f"meta: invalid bpm {song.bpm}")
 
-    track_names = {t.name for t in song.tracks}
+    # First track wins on duplicate names, as everywhere else
+    tracks_by_name = {t.name: t for t in reversed(song.tracks)}
 
     # Check pattern references
     for track in song.tracks:
@@ -301,10 +335,10 @@ def validate(song: Song) -> list[str]:
     # Check scenes reference valid tracks and clips
     for scene in song.scenes:
         for tname, cname in scene.clips.items():
-            if tname not in track_names:
+            track = tracks_by_name.get(tname)
+            if track is None:
                 errors.append(f"scene '{scene.name}': references unknown track '{tname}'")
                 continue
-            track = next(t for t in song.tracks if t.name == tname)
             if cname not in track.clips and cname not in song.patterns:
                 errors.append(f"scene '{scene.name}': track '{tname}' has no clip '{cname}'")
 
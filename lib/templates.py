@@ -5,17 +5,10 @@ Instruments must be added manually in Ableton after track creation
 (AbletonOSC doesn't support loading devices yet).
 """
 
+import functools
 import time
 from . import osc
 
-# Small delay between OSC messages to let Ableton process them
-MSG_DELAY = 0.05
-
-
-def _send(fn, *args):
-    fn(*args)
-    time.sleep(MSG_DELAY)
-
 
 # ── Note/pattern helpers ──────────────────────────────────
 
@@ -33,22 +26,23 @@ HI_TOM = 50
 SHAKER = 70
 CLAVE = 75
 
-# Note names to MIDI numbers
+# Note names to pitch classes
+NOTE_NAMES = {'C': 0, 'C#': 1, 'Db': 1, 'D': 2, 'D#': 3, 'Eb': 3,
+              'E': 4, 'F': 5, 'F#': 6, 'Gb': 6, 'G': 7, 'G#': 8,
+              'Ab': 8, 'A': 9, 'A#': 10, 'Bb': 10, 'B': 11}
+
+
 def note(name: str, octave: int = 4) -> int:
     """Convert note name to MIDI number. e.g. note('C', 4) = 60"""
-    names = {'C': 0, 'C#': 1, 'Db': 1, 'D': 2, 'D#': 3, 'Eb': 3,
-             'E': 4, 'F': 5, 'F#': 6, 'Gb': 6, 'G': 7, 'G#': 8,
-             'Ab': 8, 'A': 9, 'A#': 10, 'Bb': 10, 'B': 11}
-    return names[name] + (octave + 1) * 12
+    return NOTE_NAMES[name] + (octave + 1) * 12
 
 
 def _write_clip(track: int, slot: int, name: str, length: float, notes: list):
     """Create a clip and write notes into it."""
-    _send(osc.create_clip, track, slot, length)
-    time.sleep(0.1)  # extra delay for clip creation
+    osc.create_clip(track, slot, length)
     if notes:
-        _send(osc.add_notes, track, slot, notes)
-    _send(osc.set_clip_name, track, slot, name)
+        osc.add_notes(track, slot, notes)
+    osc.set_clip_name(track, slot, name)
 
 
 # ── Band Template ─────────────────────────────────────────
@@ -64,9 +58,12 @@ BAND_TRACKS = [
     {"name": "Vox / FX",    "type": "audio", "instrument": "— (audio track for samples)"},
 ]
 
-
+@functools.cache
 def _drum_patterns() -> dict[str, tuple[float, list]]:
-    """Return named drum patterns as {name: (length_beats, notes)}."""
+    """Return named drum patterns as {name: (length_beats, notes)}.
+
+    Each pattern bank is built once and cached; callers only read it.
+    """
     return {
         "Basic Beat": (4.0, [
             # Kick on 1 and 3
@@ -118,6 +115,7 @@ def _drum_patterns() -> dict[str, tuple[float, list]]:
     }
 
 
+@functools.cache
 def _bass_patterns() -> dict[str, tuple[float, list]]:
     """Bass patterns in A minor (root = A1 = 33)."""
     A1, C2, D2, E2, F2, G2 = 33, 36, 38, 40, 41, 43
@@ -151,6 +149,7 @@ def _bass_patterns() -> dict[str, tuple[float, list]]:
     }
 
 
+@functools.cache
 def _keys_patterns() -> dict[str, tuple[float, list]]:
     """Keys/piano patterns — Am, F, C, G chord progression."""
     return {
@@ -177,6 +176,7 @@ def _keys_patterns() -> dict[str, tuple[float, list]]:
     }
 
 
+@functools.cache
 def _lead_patterns() -> dict[str, tuple[float, list]]:
     """Simple synth lead melodies in A minor."""
     return {
@@ -202,6 +202,7 @@ def _lead_patterns() -> dict[str, tuple[float, list]]:
     }
 
 
+@functools.cache
 def _pad_patterns() -> dict[str, tuple[float, list]]:
     """Synth pad — long sustained chords."""
     return {
@@ -214,6 +215,7 @@ def _pad_patterns() -> dict[str, tuple[float, list]]:
     }
 
 
+@functools.cache
 def _perc_patterns() -> dict[str, tuple[float, list]]:
     """Percussion layers — shaker, clave, toms."""
     return {
@@ -245,104 +247,98 @@ def setup_band(bpm: float = 120.0, delete_existing: bool = False):
     """
     print(f"Setting up band template at {bpm} BPM...")
 
-    # Set tempo
-    _send(osc.set_tempo, bpm)
+    # Pattern bank written to each track (the rest start empty)
+    banks = {
+        0: _drum_patterns(),
+        1: _bass_patterns(),
+        2: _keys_patterns(),
+        3: _lead_patterns(),
+        4: _pad_patterns(),
+        6: _perc_patterns(),
+    }
 
+    # Same delivery as `push`: OSC bundles that AbletonOSC applies in order
+    # on Live's main thread, so tracks can be created, named and filled in
+    # one bundle. Only the clear gets a pause before the build.
+    with osc.bundle():
+        osc.set_tempo(bpm)
+        if delete_existing:
+            # No track count without the query module's server, so delete
+            # from a fixed upper bound down to 0
+            print("  Clearing existing tracks...")
+            for i in range(15, -1, -1):
+                osc.delete_track(i)
     if delete_existing:
-        # Query track count and delete all existing tracks (reverse order)
-        print("  Clearing existing tracks...")
-        # We can't easily query track count without the query module's server,
-        # so we'll just try deleting tracks 7 down to 0
-        for i in range(15, -1, -1):
-            try:
-                _send(osc.delete_track, i)
-            except Exception:
-                pass
         time.sleep(0.5)
 
-    # Create tracks
-    print("  Creating tracks...")
-    for i, t in enumerate(BAND_TRACKS):
-        if t["type"] == "midi":
-            _send(osc.create_midi_track, -1)
-        else:
-            _send(osc.create_audio_track, -1)
-        time.sleep(0.1)
-
-    # Wait for Ableton to process
-    time.sleep(0.5)
-
-    # We need to figure out the track offset. If there was already a default
-    # track, our new tracks start at index 1 (or wherever). Let's query.
-    # For simplicity, we'll assume we're appending to whatever exists.
-    # The user said they have 1 track, so our tracks start at index 1.
-    # But if delete_existing was used, they start at 0.
-    # We'll name based on the expected starting position.
-
-    # Name tracks — we'll name all tracks we can find
-    print("  Naming tracks...")
-    for i, t in enumerate(BAND_TRACKS):
-        _send(osc.set_track_name, i, t["name"])
-
-    time.sleep(0.3)
-
-    # Write drum patterns (track 0)
-    print("  Writing drum patterns...")
-    for slot, (name, (length, notes)) in enumerate(_drum_patterns().items()):
-        _write_clip(0, slot, name, length, notes)
-
-    # Write bass patterns (track 1)
-    print("  Writing bass patterns...")
-    for slot, (name, (length, notes)) in enumerate(_bass_patterns().items()):
-        _write_clip(1, slot, name, length, notes)
-
-    # Write keys patterns (track 2)
-    print("  Writing keys patterns...")
-    for slot, (name, (length, notes)) in enumerate(_keys_patterns().items()):
-        _write_clip(2, slot, name, length, notes)
-
-    # Write lead patterns (track 3)
-    print("  Writing lead patterns...")
-    for slot, (name, (length, notes)) in enumerate(_lead_patterns().items()):
-        _write_clip(3, slot, name, length, notes)
-
-    # Write pad patterns (track 4)
-    print("  Writing pad patterns...")
-    for slot, (name, (length, notes)) in enumerate(_pad_patterns().items()):
-        _write_clip(4, slot, name, length, notes)
-
-    # Track 5 (Guitar) — empty, user loads samples
-    # Track 7 (Vox/FX) — audio track, user drops in clips
-
-    # Write perc patterns (track 6)
-    print("  Writing percussion patterns...")
-    for slot, (name, (length, notes)) in enumerate(_perc_patterns().items()):
-        _write_clip(6, slot, name, length, notes)
-
-    # Set initial volumes
-    print("  Setting mixer levels...")
-    levels = {
-        0: 0.85,  # Drums
-        1: 0.80,  # Bass
-        2: 0.70,  # Keys
-        3: 0.65,  # Lead
-        4: 0.55,  # Pad
-        5: 0.70,  # Guitar
-        6: 0.50,  # Perc
-        7: 0.75,  # Vox
-    }
-    for track, vol in levels.items():
-        _send(osc.set_volume, track, vol)
-
-    # Disarm all except track 0
-    for i in range(8):
-        _send(osc.disarm, i)
+    with osc.bundle():
+        # New tracks are appended; names assume they start at index 0, which
+        # holds after delete_existing
+        print("  Creating tracks...")
+        for i, t in enumerate(BAND_TRACKS):
+            if t["type"] == "midi":
+                osc.create_midi_track(-1)
+            else:
+                osc.create_audio_track(-1)
+            osc.set_track_name(i, t["name"])
+
+        # Write drum patterns (track 0)
+        print("  Writing drum patterns...")
+        for slot, (name, (length, notes)) in enumerate(banks[0].items()):
+            _write_clip(0, slot, name, length, notes)
+
+        # Write bass patterns (track 1)
+        print("  Writing bass patterns...")
+        for slot, (name, (length, notes)) in enumerate(banks[1].items()):
+            _write_clip(1, slot, name, length, notes)
+
+        # Write keys patterns (track 2)
+        print("  Writing keys patterns...")
+        for slot, (name, (length, notes)) in enumerate(banks[2].items()):
+            _write_clip(2, slot, name, length, notes)
+
+        # Write lead patterns (track 3)
+        print("  Writing lead patterns...")
+        for slot, (name, (length, notes)) in enumerate(banks[3].items()):
+            _write_clip(3, slot, name, length, notes)
+
+        # Write pad patterns (track 4)
+        print("  Writing pad patterns...")
+        for slot, (name, (length, notes)) in enumerate(banks[4].items()):
+            _write_clip(4, slot, name, length, notes)
+
+        # Track 5 (Guitar) — empty, user loads samples
+        # Track 7 (Vox/FX) — audio track, user drops in clips
+
+        # Write perc patterns (track 6)
+        print("  Writing percussion patterns...")
+        for slot, (name, (length, notes)) in enumerate(banks[6].items()):
+            _write_clip(6, slot, name, length, notes)
+
+        # Set initial volumes
+        print("  Setting mixer levels...")
+        levels = {
+            0: 0.85,  # Drums
+            1: 0.80,  # Bass
+            2: 0.70,  # Keys
+            3: 0.65,  # Lead
+            4: 0.55,  # Pad
+            5: 0.70,  # Guitar
+            6: 0.50,  # Perc
+            7: 0.75,  # Vox
+        }
+        for track, vol in levels.items():
+            osc.set_volume(track, vol)
+
+        # Disarm all except track 0
+        for i in range(8):
+            osc.disarm(i)
 
     print()
     print("Template ready! Now add instruments in Ableton:")
     print()
     for i, t in enumerate(BAND_TRACKS):
-        clips = {0: 4, 1: 4, 2: 2, 3: 2, 4: 1, 6: 2}.get(i, 0)
+        clips = len(banks.get(i, ()))
         clip_info = f"  ({clips} clips)" if clips else ""
         print(f"  Track {i}: {t['name']:12s} → {t['instrument']}{clip_info}")
     print()
@@ -6,7 +6,6 @@ Track 7 (Vox/FX - Mega Vox Kit): vocal stabs, breaths, atmosphere
 """
 
 import sys
-import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -108,22 +107,26 @@ VOX_FX = {
     ],
 }
 
+# osc.add_notes takes (pitch, start, dur, vel, mute) — add the mute flag once
+PERC_FX = {scene: [(*n, 0) for n in hits] for scene, hits in PERC_FX.items()}
+VOX_FX = {scene: [(*n, 0) for n in hits] for scene, hits in VOX_FX.items()}
+
+
 def create_fx_clips(track, fx_data, name_prefix):
     for scene in range(8):
         notes = fx_data.get(scene, [])
         if not notes:
             continue
 
-        osc.create_clip(track, scene, CLIP_LENGTH)
-        time.sleep(0.05)
-
-        note_tuples = [(p, s, d, v, 0) for p, s, d, v in notes]
-        osc.add_notes(track, scene, note_tuples)
-
         clip_name = f"{name_prefix} {scene+1}"
-        osc.set_clip_name(track, scene, clip_name)
+
+        # One bundle per clip: AbletonOSC applies it in order, so the clip
+        # exists before its notes and name land — no pacing needed
+        with osc.bundle():
+            osc.create_clip(track, scene, CLIP_LENGTH)
+            osc.add_notes(track, scene, notes)
+            osc.set_clip_name(track, scene, clip_name)
         print(f"  Scene {scene}: {clip_name} ({len(notes)} hits)")
-        time.sleep(0.05)
 
 
 def main():